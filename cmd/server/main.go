@@ -2,10 +2,13 @@ package main
 
 import (
 	"context"
+	"errors"
 	"flag"
 	"fmt"
 	"log"
 	"os"
+	"os/signal"
+	"syscall"
 
 	// Clean Architecture imports
 	"url-db/internal/config"
@@ -129,8 +132,11 @@ func main() {
 			mcpServer.SetPort(*port)
 		}
 
-		ctx := context.Background()
-		if err := mcpServer.Start(ctx); err != nil {
+		// Stop on SIGINT/SIGTERM so the deferred database close runs and releases the
+		// database file instead of leaving it to process teardown
+		ctx, stop := signal.NotifyContext(context.Background(), os.Interrupt, syscall.SIGTERM)
+		defer stop()
+		if err := mcpServer.Start(ctx); err != nil && !errors.Is(err, context.Canceled) {
 			if *mcpMode == constants.MCPModeStdio {
 				// In stdio mode, write error to stderr and exit silently
 				fmt.Fprintf(os.Stderr, "Failed to start MCP server: %v\n", err)
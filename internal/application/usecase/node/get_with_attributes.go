@@ -2,6 +2,7 @@ package node
 
 import (
 	"context"
+	"fmt"
 	"url-db/internal/application/dto/response"
 	"url-db/internal/domain/repository"
 )
@@ -35,12 +36,18 @@ func (uc *GetNodeWithAttributesUseCase) Execute(ctx context.Context, nodeID int)
 	if err != nil {
 		return nil, err
 	}
+	if node == nil {
+		return nil, fmt.Errorf("node not found: %d", nodeID)
+	}
 
 	// Get domain information
 	domain, err := uc.nodeRepo.GetDomainByNodeID(ctx, nodeID)
 	if err != nil {
 		return nil, err
 	}
+	if domain == nil {
+		return nil, fmt.Errorf("domain not found for node: %d", nodeID)
+	}
 
 	// Get node attributes
 	nodeAttributes, err := uc.nodeAttributeRepo.GetByNodeID(ctx, nodeID)
@@ -60,17 +67,25 @@ func (uc *GetNodeWithAttributesUseCase) Execute(ctx context.Context, nodeID int)
 	}
 
 	// Convert attributes to response
-	var attributeResponses []response.NodeAttributeResponse
+	attributeResponses := make([]response.NodeAttributeResponse, 0, len(nodeAttributes))
 	for _, nodeAttr := range nodeAttributes {
-		// Get attribute definition to show name and type
-		attr, err := uc.attributeRepo.GetByID(ctx, nodeAttr.AttributeID())
-		if err != nil {
-			continue // Skip if attribute definition not found
+		// Name and type are joined in by GetByNodeID; only fetch the definition if missing
+		attrName := nodeAttr.Name()
+		attrType := ""
+		if nodeAttr.AttributeType() != nil {
+			attrType = *nodeAttr.AttributeType()
+		}
+		if attrName == "" {
+			attr, err := uc.attributeRepo.GetByID(ctx, nodeAttr.AttributeID())
+			if err != nil || attr == nil {
+				continue // Skip if attribute definition not found
+			}
+			attrName, attrType = attr.Name(), attr.Type()
 		}
 
 		attrResponse := response.NodeAttributeResponse{
-			AttributeName: attr.Name(),
-			AttributeType: attr.Type(),
+			AttributeName: attrName,
+			AttributeType: attrType,
 			Value:         nodeAttr.Value(),
 		}
 
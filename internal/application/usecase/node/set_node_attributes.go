@@ -62,25 +62,37 @@ func (uc *SetNodeAttributesUseCase) Execute(ctx context.Context, nodeID int, att
 		return fmt.Errorf("domain not found for node: %d", nodeID)
 	}
 
+	// Load the domain's attribute definitions once instead of once per input attribute
+	definitions, err := uc.attributeRepo.ListByDomainID(ctx, domain.ID())
+	if err != nil {
+		return fmt.Errorf("failed to get attributes for domain '%s': %w", domain.Name(), err)
+	}
+	attrsByName := make(map[string]*entity.Attribute, len(definitions))
+	for _, attr := range definitions {
+		attrsByName[attr.Name()] = attr
+	}
+
+	// Validate all values against the domain's templates in one pass (진입점 제약)
+	values := make([]service.AttributeValue, len(attributes))
+	for i, attrInput := range attributes {
+		values[i] = service.AttributeValue{Name: attrInput.Name, Value: attrInput.Value}
+	}
+	templateValidations, err := uc.templateService.ValidateAttributeValues(ctx, domain.Name(), values)
+	if err != nil {
+		return fmt.Errorf("template validation error: %w", err)
+	}
+
 	// Process and validate each attribute
-	var nodeAttributes []*entity.NodeAttribute
-	for _, attrInput := range attributes {
+	nodeAttributes := make([]*entity.NodeAttribute, 0, len(attributes))
+	for i, attrInput := range attributes {
 		// Get attribute definition from domain
-		attr, err := uc.attributeRepo.GetByName(ctx, domain.ID(), attrInput.Name)
-		if err != nil {
-			return fmt.Errorf("failed to get attribute '%s': %w", attrInput.Name, err)
-		}
+		attr := attrsByName[attrInput.Name]
 		if attr == nil {
 			return fmt.Errorf("attribute '%s' not defined in domain '%s'", attrInput.Name, domain.Name())
 		}
 
-		// Validate attribute value against templates (진입점 제약)
-		templateValidation, err := uc.templateService.ValidateAttributeValue(ctx, domain.Name(), attrInput.Name, attrInput.Value)
-		if err != nil {
-			return fmt.Errorf("template validation error for attribute '%s': %w", attrInput.Name, err)
-		}
-
 		// Reject if template validation fails
+		templateValidation := templateValidations[i]
 		if !templateValidation.IsValid {
 			return &TemplateValidationError{
 				AttributeName: attrInput.Name,
@@ -0,0 +1,27 @@
+package compositekey
+
+import "testing"
+
+func TestNormalizeString(t *testing.T) {
+	tests := []struct {
+		name     string
+		input    string
+		expected string
+	}{
+		{name: "빈 문자열", input: "", expected: ""},
+		{name: "공백과 대문자", input: "  My Domain  ", expected: "my-domain"},
+		{name: "연속 구분자", input: "a--b__c-_-d", expected: "a-b-c-d"},
+		{name: "특수문자", input: "api.v2/docs!", expected: "api-v2-docs"},
+		{name: "앞뒤 구분자", input: "_-tool-_", expected: "tool"},
+		{name: "비 ASCII 문자", input: "한글abc", expected: "abc"},
+		{name: "구분자만 존재", input: "-_- ", expected: ""},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := normalizeString(tt.input); got != tt.expected {
+				t.Errorf("normalizeString(%q) = %q, expected %q", tt.input, got, tt.expected)
+			}
+		})
+	}
+}
@@ -11,6 +11,7 @@ type Config struct {
 	ForeignKeys     bool
 	JournalMode     string
 	Synchronous     string
+	BusyTimeout     time.Duration
 }
 
 func DefaultConfig() *Config {
@@ -23,6 +24,7 @@ func DefaultConfig() *Config {
 		ForeignKeys:     true,
 		JournalMode:     "WAL",
 		Synchronous:     "NORMAL",
+		BusyTimeout:     5 * time.Second,
 	}
 }
 
@@ -31,7 +33,7 @@ func TestConfig() *Config {
 		URL:             ":memory:",
 		MaxOpenConns:    1,
 		MaxIdleConns:    1,
-		ConnMaxLifetime: time.Hour,
+		ConnMaxLifetime: 0, // recycling the only connection would discard the in-memory database
 		WALMode:         false,
 		ForeignKeys:     true,
 		JournalMode:     "DELETE",
@@ -49,5 +51,6 @@ func ProductionConfig(dbPath string) *Config {
 		ForeignKeys:     true,
 		JournalMode:     "WAL",
 		Synchronous:     "FULL",
+		BusyTimeout:     5 * time.Second,
 	}
 }
@@ -6,6 +6,7 @@ import (
 	"os"
 	"path/filepath"
 	"strings"
+	"sync"
 
 	"github.com/jmoiron/sqlx"
 	_ "github.com/mattn/go-sqlite3"
@@ -14,10 +15,37 @@ import (
 // Schema file path relative to project root
 const schemaFilePath = "schema.sql"
 
-// isMCPServerMode checks if the application is running in MCP server mode
+var (
+	mcpServerModeOnce sync.Once
+	mcpServerMode     bool
+)
+
+// isMCPServerMode checks if the application is running in MCP server mode.
+// The environment and arguments do not change at runtime, so they are probed only once.
 func isMCPServerMode() bool {
-	return os.Getenv("MCP_MODE") == "stdio" || 
-		   strings.Contains(strings.Join(os.Args, " "), "-mcp-mode=stdio")
+	mcpServerModeOnce.Do(func() {
+		mcpServerMode = os.Getenv("MCP_MODE") == "stdio" || hasStdioModeArg(os.Args[1:])
+	})
+	return mcpServerMode
+}
+
+// hasStdioModeArg reports whether the arguments select stdio MCP mode. The flag package
+// accepts "-mcp-mode=stdio", "-mcp-mode stdio" and the double-dash forms, so all of them
+// are recognised; otherwise a client that spawns the server with a separate value would
+// receive log output on stderr, and a client that never drains that pipe would
+// eventually block the server on a full pipe buffer.
+func hasStdioModeArg(args []string) bool {
+	for i, arg := range args {
+		switch arg {
+		case "-mcp-mode=stdio", "--mcp-mode=stdio":
+			return true
+		case "-mcp-mode", "--mcp-mode":
+			if i+1 < len(args) && args[i+1] == "stdio" {
+				return true
+			}
+		}
+	}
+	return false
 }
 
 // logInfo logs info message only if not in MCP stdio mode
@@ -43,7 +71,7 @@ func New(config *Config) (*Database, error) {
 		return nil, fmt.Errorf("failed to ensure database exists: %w", err)
 	}
 
-	db, err := sql.Open("sqlite3", config.URL)
+	db, err := sql.Open("sqlite3", connectionDSN(config))
 	if err != nil {
 		return nil, fmt.Errorf("failed to open database: %w", err)
 	}
@@ -70,28 +98,50 @@ func New(config *Config) (*Database, error) {
 	return database, nil
 }
 
-func configureDatabase(db *sql.DB, config *Config) error {
-	db.SetMaxOpenConns(config.MaxOpenConns)
-	db.SetMaxIdleConns(config.MaxIdleConns)
-	db.SetConnMaxLifetime(config.ConnMaxLifetime)
+// connectionDSN appends per-connection settings to the database URL. PRAGMA statements
+// run through db.Exec only reach a single pooled connection, whereas DSN parameters are
+// applied by the driver to every connection it opens. The busy timeout lets concurrent
+// writers wait for the lock instead of failing with SQLITE_BUSY.
+func connectionDSN(config *Config) string {
+	var params []string
+	if config.Synchronous != "" {
+		params = append(params, "_synchronous="+config.Synchronous)
+	}
+	if config.ForeignKeys {
+		params = append(params, "_foreign_keys=1")
+	}
+	if config.BusyTimeout > 0 {
+		params = append(params, fmt.Sprintf("_busy_timeout=%d", config.BusyTimeout.Milliseconds()))
+	}
 
-	pragmas := []string{
-		fmt.Sprintf("PRAGMA journal_mode = %s", config.JournalMode),
-		fmt.Sprintf("PRAGMA synchronous = %s", config.Synchronous),
+	if len(params) == 0 {
+		return config.URL
 	}
 
-	if config.ForeignKeys {
-		pragmas = append(pragmas, "PRAGMA foreign_keys = ON")
+	separator := "?"
+	if strings.Contains(config.URL, "?") {
+		separator = "&"
 	}
+	return config.URL + separator + strings.Join(params, "&")
+}
+
+func configureDatabase(db *sql.DB, config *Config) error {
+	db.SetMaxOpenConns(config.MaxOpenConns)
+	db.SetMaxIdleConns(config.MaxIdleConns)
+	db.SetConnMaxLifetime(config.ConnMaxLifetime)
 
+	// Synchronous mode and foreign keys are already applied to every connection through
+	// the DSN (see connectionDSN). Only the journal mode, which is stored in the database
+	// file itself, is set here, and only once: WALMode overrides JournalMode instead of
+	// switching the journal a second time on every start.
+	journalMode := config.JournalMode
 	if config.WALMode {
-		pragmas = append(pragmas, "PRAGMA journal_mode = WAL")
+		journalMode = "WAL"
 	}
 
-	for _, pragma := range pragmas {
-		if _, err := db.Exec(pragma); err != nil {
-			return fmt.Errorf("failed to execute pragma %s: %w", pragma, err)
-		}
+	pragma := fmt.Sprintf("PRAGMA journal_mode = %s", journalMode)
+	if _, err := db.Exec(pragma); err != nil {
+		return fmt.Errorf("failed to execute pragma %s: %w", pragma, err)
 	}
 
 	return nil
@@ -339,9 +389,29 @@ func (d *Database) SQLXDB() *sqlx.DB {
 func InitDB(url string) (*Database, error) {
 	config := DefaultConfig()
 	config.URL = url
+	if isInMemoryURL(url) {
+		// Every connection to :memory: opens its own private database, so the pool
+		// must hold exactly one connection that is never recycled
+		config.MaxOpenConns = 1
+		config.MaxIdleConns = 1
+		config.ConnMaxLifetime = 0
+	}
 	return New(config)
 }
 
+// isInMemoryURL reports whether a SQLite URL refers to an in-memory database,
+// e.g. ":memory:", "file::memory:" or "file:name?mode=memory"
+func isInMemoryURL(url string) bool {
+	path := strings.TrimPrefix(url, "file:")
+	if i := strings.IndexByte(path, '?'); i >= 0 {
+		if strings.Contains(path[i+1:], "mode=memory") {
+			return true
+		}
+		path = path[:i]
+	}
+	return path == ":memory:"
+}
+
 // ensureDatabaseExists creates the database file and directory if they don't exist
 func ensureDatabaseExists(url string) error {
 	// Parse the database URL to extract the file path
@@ -394,7 +464,7 @@ func parseDatabasePath(url string) (string, error) {
 	// - path/to/db.sqlite (direct path)
 	// - :memory: (in-memory)
 
-	if url == ":memory:" {
+	if isInMemoryURL(url) {
 		return ":memory:", nil
 	}
 
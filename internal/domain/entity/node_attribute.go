@@ -84,6 +84,11 @@ func (na *NodeAttribute) SetID(id int) {
 	na.id = id
 }
 
+// SetCreatedAt sets the creation timestamp (used by repository)
+func (na *NodeAttribute) SetCreatedAt(createdAt time.Time) {
+	na.createdAt = createdAt
+}
+
 // SetName sets the attribute name (used by repository)
 func (na *NodeAttribute) SetName(name string) {
 	na.name = name
@@ -344,22 +344,29 @@ func (cs *ContentScanner) analyzeAttributesForCompression(allAttributes map[int]
 	}
 }
 
+// attributeValueKey identifies an attribute value by attribute name and value
+type attributeValueKey struct {
+	name  string
+	value string
+}
+
 // compressAttributes applies compression to attributes by removing duplicates
 func (cs *ContentScanner) compressAttributes(attributes []*entity.NodeAttribute, summary *AttributeSummary) []response.AttributeValue {
 	if len(attributes) == 0 {
 		return nil
 	}
 
-	// Group by attribute name and only show unique values
-	seen := make(map[string]bool)
-	compressed := make([]response.AttributeValue, 0)
+	// Group by attribute name and only show unique values; the (name, value) pair is
+	// used as the key directly so no key string is built per attribute
+	seen := make(map[attributeValueKey]struct{}, len(attributes))
+	compressed := make([]response.AttributeValue, 0, len(attributes))
 
 	for _, attr := range attributes {
-		key := attr.Name() + ":" + attr.Value()
-		if seen[key] {
+		key := attributeValueKey{name: attr.Name(), value: attr.Value()}
+		if _, ok := seen[key]; ok {
 			continue // Skip duplicate
 		}
-		seen[key] = true
+		seen[key] = struct{}{}
 
 		compressed = append(compressed, response.AttributeValue{
 			Name:          attr.Name(),
@@ -6,6 +6,7 @@ import (
 	"errors"
 	"fmt"
 	"strings"
+	"sync"
 	"url-db/internal/constants"
 	"url-db/internal/domain/entity"
 	"url-db/internal/domain/repository"
@@ -48,6 +49,7 @@ type TemplateService interface {
 
 	// Template-based attribute value validation
 	ValidateAttributeValue(ctx context.Context, domainName, attributeName, value string) (*AttributeValidationResult, error)
+	ValidateAttributeValues(ctx context.Context, domainName string, values []AttributeValue) ([]*AttributeValidationResult, error)
 }
 
 type templateService struct {
@@ -55,6 +57,16 @@ type templateService struct {
 	domainRepo   repository.DomainRepository
 	attrRepo     repository.AttributeRepository
 	validator    *validation.TemplateValidator
+
+	// parsedTemplates caches decoded template data by template ID (*parsedTemplate)
+	parsedTemplates sync.Map
+}
+
+// parsedTemplate holds decoded template data along with the raw JSON it was decoded
+// from, so a cached entry is reused only while the template is unchanged
+type parsedTemplate struct {
+	raw  string
+	data map[string]interface{}
 }
 
 // NewTemplateService creates a new template service
@@ -227,6 +239,7 @@ func (s *templateService) DeleteTemplate(ctx context.Context, id int) error {
 	if err := s.templateRepo.Delete(ctx, id); err != nil {
 		return fmt.Errorf("failed to delete template: %w", err)
 	}
+	s.parsedTemplates.Delete(id)
 
 	return nil
 }
@@ -522,6 +535,12 @@ type AttributeValidationResult struct {
 	ValidationMethod  string   `json:"validation_method,omitempty"`
 }
 
+// AttributeValue is an attribute name and value pair to validate against templates
+type AttributeValue struct {
+	Name  string
+	Value string
+}
+
 // Template-based attribute value validation errors
 var (
 	ErrTemplateValueNotAllowed     = constants.ErrTemplateValueNotAllowed
@@ -544,11 +563,44 @@ func (s *templateService) ValidateAttributeValue(ctx context.Context, domainName
 	}
 
 	// Find active templates for this domain that define constraints for this attribute
+	templates, err := s.listActiveTemplates(ctx, domainName)
+	if err != nil {
+		return nil, err
+	}
+
+	return s.validateAgainstTemplates(templates, attributeName, value), nil
+}
+
+// ValidateAttributeValues validates several attribute values of one domain against its
+// templates, loading the domain's active templates once for the whole set. Unlike
+// ValidateAttributeValue it does not look up the domain or the attributes, which the
+// caller is expected to have resolved already. Results are in the order of values.
+func (s *templateService) ValidateAttributeValues(ctx context.Context, domainName string, values []AttributeValue) ([]*AttributeValidationResult, error) {
+	templates, err := s.listActiveTemplates(ctx, domainName)
+	if err != nil {
+		return nil, err
+	}
+
+	results := make([]*AttributeValidationResult, len(values))
+	for i, v := range values {
+		results[i] = s.validateAgainstTemplates(templates, v.Name, v.Value)
+	}
+
+	return results, nil
+}
+
+// listActiveTemplates returns the active templates of a domain
+func (s *templateService) listActiveTemplates(ctx context.Context, domainName string) ([]*entity.Template, error) {
 	templates, _, err := s.templateRepo.ListActive(ctx, domainName, 1, 100) // Get all active templates
 	if err != nil {
 		return nil, fmt.Errorf("failed to get templates: %w", err)
 	}
+	return templates, nil
+}
 
+// validateAgainstTemplates validates a value against the first template that defines
+// constraints for the attribute
+func (s *templateService) validateAgainstTemplates(templates []*entity.Template, attributeName, value string) *AttributeValidationResult {
 	var applicableTemplate *entity.Template
 	var allowedValues []string
 	var validationMethod string
@@ -559,8 +611,7 @@ func (s *templateService) ValidateAttributeValue(ctx context.Context, domainName
 			continue
 		}
 
-		templateData := template.TemplateData()
-		constraints, found := s.extractAttributeConstraints(templateData, attributeName)
+		constraints, found := s.extractAttributeConstraints(template, attributeName)
 		if found {
 			applicableTemplate = template
 			validationMethod, allowedValues = s.parseConstraints(constraints)
@@ -573,7 +624,7 @@ func (s *templateService) ValidateAttributeValue(ctx context.Context, domainName
 		return &AttributeValidationResult{
 			IsValid:          true,
 			ValidationMethod: constants.ValidationMethodNoConstraints,
-		}, nil
+		}
 	}
 
 	// Validate the value against template constraints
@@ -582,13 +633,32 @@ func (s *templateService) ValidateAttributeValue(ctx context.Context, domainName
 	result.ValidationMethod = validationMethod
 	result.AllowedValues = allowedValues
 
-	return result, nil
+	return result
 }
 
-// extractAttributeConstraints extracts constraints for a specific attribute from template data
-func (s *templateService) extractAttributeConstraints(templateData, attributeName string) (interface{}, bool) {
+// templateData returns the decoded data of a template. Every attribute value validation
+// scans all active templates of the domain, so decoding is cached per template and only
+// repeated when the template's JSON changes. The returned map must not be modified.
+func (s *templateService) templateData(template *entity.Template) (map[string]interface{}, bool) {
+	raw := template.TemplateData()
+	if cached, ok := s.parsedTemplates.Load(template.ID()); ok {
+		if entry := cached.(*parsedTemplate); entry.raw == raw {
+			return entry.data, true
+		}
+	}
+
 	var data map[string]interface{}
-	if err := json.Unmarshal([]byte(templateData), &data); err != nil {
+	if err := json.Unmarshal([]byte(raw), &data); err != nil {
+		return nil, false
+	}
+	s.parsedTemplates.Store(template.ID(), &parsedTemplate{raw: raw, data: data})
+	return data, true
+}
+
+// extractAttributeConstraints extracts constraints for a specific attribute from template data
+func (s *templateService) extractAttributeConstraints(template *entity.Template, attributeName string) (interface{}, bool) {
+	data, ok := s.templateData(template)
+	if !ok {
 		return nil, false
 	}
 
@@ -31,6 +31,7 @@ func MapNodeAttributeModelToEntity(model *NodeAttributeModel) *entity.NodeAttrib
 
 	// Set the ID and creation time from database
 	nodeAttribute.SetID(model.ID)
+	nodeAttribute.SetCreatedAt(model.CreatedAt)
 
 	return nodeAttribute
 }
@@ -97,7 +97,7 @@ func (r *domainRepository) List(ctx context.Context, page, size int) ([]*entity.
 	}
 	defer rows.Close()
 
-	var domains []*entity.Domain
+	domains := make([]*entity.Domain, 0, pageCapacity(totalCount, offset, size))
 	for rows.Next() {
 		var dbRow mapper.DatabaseDomain
 		err := rows.Scan(
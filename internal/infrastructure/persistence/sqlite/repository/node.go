@@ -122,7 +122,7 @@ func (r *nodeRepository) List(ctx context.Context, domainName string, page, size
 	}
 	defer rows.Close()
 
-	var nodes []*entity.Node
+	nodes := make([]*entity.Node, 0, pageCapacity(totalCount, offset, size))
 	for rows.Next() {
 		var dbRow mapper.DatabaseNode
 		err := rows.Scan(
@@ -233,7 +233,7 @@ func (r *nodeRepository) GetBatch(ctx context.Context, ids []int) ([]*entity.Nod
 	}
 	defer rows.Close()
 
-	var nodes []*entity.Node
+	nodes := make([]*entity.Node, 0, len(ids))
 	for rows.Next() {
 		var dbRow mapper.DatabaseNode
 		err := rows.Scan(
@@ -378,7 +378,7 @@ func (r *nodeRepository) FilterByAttributes(ctx context.Context, domainName stri
 	}
 	defer rows.Close()
 
-	var nodes []*entity.Node
+	nodes := make([]*entity.Node, 0, pageCapacity(total, offset, size))
 	for rows.Next() {
 		var dbRow mapper.DatabaseNode
 		err := rows.Scan(
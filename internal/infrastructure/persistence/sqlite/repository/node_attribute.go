@@ -200,8 +200,15 @@ func (r *sqliteNodeAttributeRepository) SetNodeAttributes(ctx context.Context, n
 		VALUES (?, ?, ?, ?, ?)
 	`
 
+	// Prepare the insert once and reuse it for every attribute in the batch
+	stmt, err := tx.PrepareContext(ctx, insertQuery)
+	if err != nil {
+		return fmt.Errorf("failed to prepare statement: %w", err)
+	}
+	defer stmt.Close()
+
 	for _, attr := range attributes {
-		_, err = tx.ExecContext(ctx, insertQuery,
+		_, err = stmt.ExecContext(ctx,
 			attr.NodeID(),
 			attr.AttributeID(),
 			attr.Value(),
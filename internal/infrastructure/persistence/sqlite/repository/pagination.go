@@ -0,0 +1,15 @@
+package repository
+
+// pageCapacity returns how many rows a LIMIT/OFFSET page can contain given the total
+// row count, so result slices can be sized before scanning without over-allocating
+// for large page sizes
+func pageCapacity(total, offset, size int) int {
+	remaining := total - offset
+	if remaining < 0 {
+		return 0
+	}
+	if size < remaining {
+		return size
+	}
+	return remaining
+}
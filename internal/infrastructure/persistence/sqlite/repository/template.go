@@ -129,7 +129,7 @@ func (r *templateRepository) List(ctx context.Context, domainName string, page,
 	}
 	defer rows.Close()
 
-	var templates []*entity.Template
+	templates := make([]*entity.Template, 0, pageCapacity(total, offset, size))
 	for rows.Next() {
 		var dbRow mapper.DatabaseTemplate
 		err := rows.Scan(
@@ -181,7 +181,7 @@ func (r *templateRepository) ListActive(ctx context.Context, domainName string,
 	}
 	defer rows.Close()
 
-	var templates []*entity.Template
+	templates := make([]*entity.Template, 0, pageCapacity(total, offset, size))
 	for rows.Next() {
 		var dbRow mapper.DatabaseTemplate
 		err := rows.Scan(
@@ -235,7 +235,7 @@ func (r *templateRepository) ListByType(ctx context.Context, domainName, templat
 	}
 	defer rows.Close()
 
-	var templates []*entity.Template
+	templates := make([]*entity.Template, 0, pageCapacity(total, offset, size))
 	for rows.Next() {
 		var dbRow mapper.DatabaseTemplate
 		err := rows.Scan(
@@ -348,7 +348,7 @@ func (r *templateRepository) GetBatch(ctx context.Context, ids []int) ([]*entity
 	}
 	defer rows.Close()
 
-	var templates []*entity.Template
+	templates := make([]*entity.Template, 0, len(ids))
 	for rows.Next() {
 		var dbRow mapper.DatabaseTemplate
 		err := rows.Scan(
@@ -467,7 +467,7 @@ func (r *templateRepository) FilterByAttributes(ctx context.Context, domainName
 	}
 	defer rows.Close()
 
-	var templates []*entity.Template
+	templates := make([]*entity.Template, 0, pageCapacity(total, offset, size))
 	for rows.Next() {
 		var dbRow mapper.DatabaseTemplate
 		err := rows.Scan(
@@ -565,7 +565,7 @@ func (r *templateRepository) GetTemplatesByDomainID(ctx context.Context, domainI
 	}
 	defer rows.Close()
 
-	var templates []*entity.Template
+	templates := make([]*entity.Template, 0, pageCapacity(total, offset, size))
 	for rows.Next() {
 		var dbRow mapper.DatabaseTemplate
 		err := rows.Scan(
@@ -697,7 +697,7 @@ func (r *templateRepository) Search(ctx context.Context, domainName, query strin
 	}
 	defer rows.Close()
 
-	var templates []*entity.Template
+	templates := make([]*entity.Template, 0, pageCapacity(total, offset, size))
 	for rows.Next() {
 		var dbRow mapper.DatabaseTemplate
 		err := rows.Scan(
@@ -88,7 +88,13 @@ func (tv *TemplateValidator) ValidateTemplate(templateData string) (*ValidationR
 		}, nil
 	}
 
-	return &ValidationResult{Valid: true}, nil
+	// Required fields are known to be strings at this point; return them so callers
+	// do not need to parse the template data again
+	return &ValidationResult{
+		Valid:   true,
+		Type:    dataMap["type"].(string),
+		Version: dataMap["version"].(string),
+	}, nil
 }
 
 // ValidateWithSchema validates data against a specific schema (placeholder)
@@ -169,6 +175,9 @@ func (tv *TemplateValidator) GenerateTemplate(templateType string) (map[string]i
 type ValidationResult struct {
 	Valid  bool              `json:"valid"`
 	Errors []ValidationError `json:"errors,omitempty"`
+	// Type and Version are populated for valid templates
+	Type    string `json:"type,omitempty"`
+	Version string `json:"version,omitempty"`
 }
 
 // ValidationError represents a single validation error
@@ -33,7 +33,7 @@ func (l *MCPLogger) Debug(message string) {
 
 // Debugf logs a formatted debug message
 func (l *MCPLogger) Debugf(format string, args ...interface{}) {
-	l.log(LogLevelDebug, fmt.Sprintf(format, args...))
+	l.logf(LogLevelDebug, format, args...)
 }
 
 // Info logs an info message using MCP structured logging if available
@@ -43,7 +43,7 @@ func (l *MCPLogger) Info(message string) {
 
 // Infof logs a formatted info message
 func (l *MCPLogger) Infof(format string, args ...interface{}) {
-	l.log(LogLevelInfo, fmt.Sprintf(format, args...))
+	l.logf(LogLevelInfo, format, args...)
 }
 
 // Warn logs a warning message using MCP structured logging if available
@@ -53,7 +53,7 @@ func (l *MCPLogger) Warn(message string) {
 
 // Warnf logs a formatted warning message
 func (l *MCPLogger) Warnf(format string, args ...interface{}) {
-	l.log(LogLevelWarn, fmt.Sprintf(format, args...))
+	l.logf(LogLevelWarn, format, args...)
 }
 
 // Error logs an error message using MCP structured logging if available
@@ -63,7 +63,7 @@ func (l *MCPLogger) Error(message string) {
 
 // Errorf logs a formatted error message
 func (l *MCPLogger) Errorf(format string, args ...interface{}) {
-	l.log(LogLevelError, fmt.Sprintf(format, args...))
+	l.logf(LogLevelError, format, args...)
 }
 
 // Fatal logs a fatal error and exits the program appropriately for MCP mode
@@ -74,10 +74,24 @@ func (l *MCPLogger) Fatal(message string) {
 
 // Fatalf logs a formatted fatal error and exits the program
 func (l *MCPLogger) Fatalf(format string, args ...interface{}) {
-	l.log(LogLevelError, fmt.Sprintf(format, args...))
+	l.logf(LogLevelError, format, args...)
 	l.handleFatal()
 }
 
+// silent reports whether every message would be dropped (stdio mode emits neither MCP log
+// notifications nor stderr output)
+func (l *MCPLogger) silent() bool {
+	return l.server != nil && l.server.GetMode() == constants.MCPModeStdio
+}
+
+// logf formats and logs a message, skipping the formatting when it would be dropped
+func (l *MCPLogger) logf(level LogLevel, format string, args ...interface{}) {
+	if l.silent() {
+		return
+	}
+	l.log(level, fmt.Sprintf(format, args...))
+}
+
 // log is the internal logging method that handles MCP vs fallback logging
 func (l *MCPLogger) log(level LogLevel, message string) {
 	// Try to send via MCP structured logging first
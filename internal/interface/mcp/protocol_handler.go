@@ -1,13 +1,30 @@
 package mcp
 
 import (
+	"bytes"
 	"context"
+	"encoding/json"
 	"fmt"
+	"strings"
+	"sync"
 
 	"url-db/internal/constants"
 	"url-db/internal/interface/setup"
 )
 
+// supportedMethods lists the JSON-RPC methods reported in method-not-found errors
+var supportedMethods = []string{"initialize", "tools/list", "tools/call", "resources/list", "resources/read"}
+
+// directToolNames holds tool names that clients sometimes send as JSON-RPC methods,
+// built once so that unknown methods are matched with a single lookup
+var directToolNames = map[string]struct{}{
+	"get_server_info": {}, "list_domains": {}, "create_domain": {}, "list_nodes": {}, "create_node": {},
+	"get_node": {}, "update_node": {}, "delete_node": {}, "find_node_by_url": {}, "scan_all_content": {},
+	"get_node_attributes": {}, "set_node_attributes": {}, "list_domain_attributes": {},
+	"create_domain_attribute": {}, "get_domain_attribute": {}, "update_domain_attribute": {},
+	"delete_domain_attribute": {},
+}
+
 // MCPProtocolHandler handles MCP JSON-RPC 2.0 protocol logic
 type MCPProtocolHandler struct {
 	factory     *setup.ApplicationFactory
@@ -24,13 +41,28 @@ func NewMCPProtocolHandler(factory *setup.ApplicationFactory, mode string) *MCPP
 	}
 }
 
-// HandleRequest processes a JSON-RPC request and returns a response
+// HandleRequest processes a JSON-RPC request and returns a response. Invalid requests
+// are always answered with an error, even without an id (JSON-RPC 2.0 §5). Valid
+// notifications (requests without an id) are processed but never answered, so a nil
+// response is returned for them.
 func (h *MCPProtocolHandler) HandleRequest(ctx context.Context, req *JSONRPCRequest) *JSONRPCResponse {
 	// Validate JSON-RPC version
 	if req.JSONRPC != constants.JSONRPCVersion {
 		return h.createErrorResponse(req.ID, InvalidRequest, "Invalid JSON-RPC version", nil)
 	}
+	if req.Method == "" {
+		return h.createErrorResponse(req.ID, InvalidRequest, "Invalid Request", "method is required")
+	}
+
+	response := h.route(ctx, req)
+	if req.ID == nil {
+		return nil
+	}
+	return response
+}
 
+// route dispatches a validated request to the handler for its method
+func (h *MCPProtocolHandler) route(ctx context.Context, req *JSONRPCRequest) *JSONRPCResponse {
 	// Route the request based on method
 	switch req.Method {
 	case "initialize":
@@ -43,39 +75,57 @@ func (h *MCPProtocolHandler) HandleRequest(ctx context.Context, req *JSONRPCRequ
 		return h.handleResourcesList(req)
 	case "resources/read":
 		return h.handleResourceRead(req)
-	case "notifications/initialized":
-		// Client notification that initialization is complete
-		// No response needed for notifications
-		return nil
 	default:
+		// MCP notifications (initialized, cancelled, progress, ...) need no handling here.
+		// Sent with an id they are ordinary requests, so they get an empty result instead
+		// of a method-not-found error; without an id HandleRequest drops the response.
+		if strings.HasPrefix(req.Method, "notifications/") {
+			return h.createSuccessResponse(req.ID, map[string]interface{}{})
+		}
+
 		// Check if this might be a direct tool call attempt
-		toolNames := []string{"get_server_info", "list_domains", "create_domain", "list_nodes", "create_node", 
-			"get_node", "update_node", "delete_node", "find_node_by_url", "scan_all_content",
-			"get_node_attributes", "set_node_attributes", "list_domain_attributes", 
-			"create_domain_attribute", "get_domain_attribute", "update_domain_attribute",
-			"delete_domain_attribute"}
-		
-		for _, toolName := range toolNames {
-			if req.Method == toolName {
-				return h.createErrorResponse(req.ID, MethodNotFound, 
-					fmt.Sprintf("Direct tool calls are not supported. Use 'tools/call' method with parameters: {\"name\":\"%s\",\"arguments\":{}}", req.Method), 
-					map[string]interface{}{
-						"hint": "Example: {\"method\":\"tools/call\",\"params\":{\"name\":\"" + req.Method + "\",\"arguments\":{}}}",
-						"available_methods": []string{"initialize", "tools/list", "tools/call", "resources/list", "resources/read"},
-					})
-			}
+		if _, ok := directToolNames[req.Method]; ok {
+			return h.createErrorResponse(req.ID, MethodNotFound,
+				fmt.Sprintf("Direct tool calls are not supported. Use 'tools/call' method with parameters: {\"name\":\"%s\",\"arguments\":{}}", req.Method),
+				map[string]interface{}{
+					"hint":              "Example: {\"method\":\"tools/call\",\"params\":{\"name\":\"" + req.Method + "\",\"arguments\":{}}}",
+					"available_methods": supportedMethods,
+				})
 		}
-		
+
 		return h.createErrorResponse(req.ID, MethodNotFound, fmt.Sprintf("Method not found: %s", req.Method), 
 			map[string]interface{}{
-				"available_methods": []string{"initialize", "tools/list", "tools/call", "resources/list", "resources/read"},
+				"available_methods": supportedMethods,
 			})
 	}
 }
 
-// handleInitialize handles MCP initialization
-func (h *MCPProtocolHandler) handleInitialize(req *JSONRPCRequest) *JSONRPCResponse {
-	result := map[string]interface{}{
+// encodedResult lazily encodes a JSON-RPC result that is constant for the lifetime of
+// the process, so it is built and encoded only once and then reused as raw bytes
+type encodedResult struct {
+	once  sync.Once
+	build func() interface{}
+	data  json.RawMessage
+	err   error
+}
+
+// get returns the encoded result, encoding it on first use. The encoder is the one the
+// transports use, so the bytes on the wire are unchanged.
+func (r *encodedResult) get() (json.RawMessage, error) {
+	r.once.Do(func() {
+		var buf bytes.Buffer
+		if err := newJSONEncoder(&buf).Encode(r.build()); err != nil {
+			r.err = fmt.Errorf("failed to encode result: %w", err)
+			return
+		}
+		r.data = bytes.TrimSuffix(buf.Bytes(), []byte("\n"))
+	})
+	return r.data, r.err
+}
+
+// initializeResult is the MCP initialize result; it depends only on constants
+var initializeResult = &encodedResult{build: func() interface{} {
+	return map[string]interface{}{
 		"protocolVersion": constants.MCPProtocolVersion,
 		"capabilities": map[string]interface{}{
 			"tools": map[string]interface{}{
@@ -91,26 +141,39 @@ func (h *MCPProtocolHandler) handleInitialize(req *JSONRPCRequest) *JSONRPCRespo
 			"version": constants.DefaultServerVersion,
 		},
 	}
+}}
 
-	return h.createSuccessResponse(req.ID, result)
-}
-
-// handleToolsList returns available MCP tools with standard format
-func (h *MCPProtocolHandler) handleToolsList(req *JSONRPCRequest) *JSONRPCResponse {
+// toolsListResult is the tools/list result. Tool definitions are static, and this is the
+// largest payload the server sends, so it is worth building only once.
+var toolsListResult = &encodedResult{build: func() interface{} {
 	toolDefs := GetToolDefinitions()
 	tools := make([]map[string]interface{}, len(toolDefs))
-	
 	for i, def := range toolDefs {
 		tools[i] = def.ToMap()
 	}
-
-	result := map[string]interface{}{
+	return map[string]interface{}{
 		"tools": tools,
 	}
+}}
 
-	return h.createSuccessResponse(req.ID, result)
+// createEncodedResponse creates a success response from a pre-encoded result
+func (h *MCPProtocolHandler) createEncodedResponse(id interface{}, result *encodedResult) *JSONRPCResponse {
+	data, err := result.get()
+	if err != nil {
+		return h.createErrorResponse(id, InternalError, "Internal error", err.Error())
+	}
+	return h.createSuccessResponse(id, data)
+}
+
+// handleInitialize handles MCP initialization
+func (h *MCPProtocolHandler) handleInitialize(req *JSONRPCRequest) *JSONRPCResponse {
+	return h.createEncodedResponse(req.ID, initializeResult)
 }
 
+// handleToolsList returns available MCP tools with standard format
+func (h *MCPProtocolHandler) handleToolsList(req *JSONRPCRequest) *JSONRPCResponse {
+	return h.createEncodedResponse(req.ID, toolsListResult)
+}
 
 // handleGetServerInfo returns server information
 func (h *MCPProtocolHandler) handleGetServerInfo(req *JSONRPCRequest) *JSONRPCResponse {
@@ -156,13 +219,5 @@ func (h *MCPProtocolHandler) createSuccessResponse(id interface{}, result interf
 
 // createErrorResponse creates an error JSON-RPC response
 func (h *MCPProtocolHandler) createErrorResponse(id interface{}, code int, message string, data interface{}) *JSONRPCResponse {
-	return &JSONRPCResponse{
-		JSONRPC: constants.JSONRPCVersion,
-		ID:      id,
-		Error: &RPCError{
-			Code:    code,
-			Message: message,
-			Data:    data,
-		},
-	}
+	return newErrorResponse(id, code, message, data)
 }
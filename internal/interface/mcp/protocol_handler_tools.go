@@ -4,8 +4,13 @@ import (
 	"context"
 	"encoding/json"
 	"fmt"
+	"time"
 )
 
+// toolCallTimeout bounds how long a single tool call may run, so a stuck query (e.g. a
+// long wait on a locked database) fails the call instead of stalling its transport
+const toolCallTimeout = 30 * time.Second
+
 // handleToolCall executes a tool call
 func (h *MCPProtocolHandler) handleToolCall(ctx context.Context, req *JSONRPCRequest) *JSONRPCResponse {
 	var params struct {
@@ -20,6 +25,9 @@ func (h *MCPProtocolHandler) handleToolCall(ctx context.Context, req *JSONRPCReq
 	// Use tool name directly without namespace
 	toolName := params.Name
 
+	ctx, cancel := context.WithTimeout(ctx, toolCallTimeout)
+	defer cancel()
+
 	var result interface{}
 	var err error
 
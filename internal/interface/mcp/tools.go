@@ -73,8 +73,8 @@ func (h *MCPToolHandler) handleListDomains(ctx context.Context, args map[string]
 	}
 
 	// Convert to MCP response format
-	content := []map[string]interface{}{}
-	structuredDomains := []map[string]interface{}{}
+	content := make([]map[string]interface{}, 0, len(result.Domains))
+	structuredDomains := make([]map[string]interface{}, 0, len(result.Domains))
 	
 	for _, domain := range result.Domains {
 		content = append(content, createTextContent(
@@ -177,8 +177,8 @@ func (h *MCPToolHandler) handleListNodes(ctx context.Context, args map[string]in
 	}
 
 	// Convert to MCP response format
-	content := []map[string]interface{}{}
-	structuredNodes := []map[string]interface{}{}
+	content := make([]map[string]interface{}, 0, len(result.Nodes))
+	structuredNodes := make([]map[string]interface{}, 0, len(result.Nodes))
 	
 	for _, node := range result.Nodes {
 		content = append(content, createTextContent(
@@ -280,16 +280,9 @@ func (h *MCPToolHandler) handleGetNode(ctx context.Context, args map[string]inte
 	}
 
 	// Parse composite ID to extract node ID
-	// composite_id format: "tool-name:domain:id"
-	parts := strings.Split(compositeID, ":")
-	if len(parts) != 3 {
-		return nil, fmt.Errorf("invalid composite_id format, expected 'tool-name:domain:id'")
-	}
-
-	nodeIDStr := parts[2]
-	nodeID, err := strconv.Atoi(nodeIDStr)
+	nodeID, err := parseCompositeID(compositeID)
 	if err != nil {
-		return nil, fmt.Errorf("invalid node ID in composite_id: %v", err)
+		return nil, err
 	}
 
 	// Get node from repository
@@ -297,6 +290,9 @@ func (h *MCPToolHandler) handleGetNode(ctx context.Context, args map[string]inte
 	if err != nil {
 		return nil, fmt.Errorf("failed to get node: %w", err)
 	}
+	if node == nil {
+		return nil, fmt.Errorf("node not found: %s", compositeID)
+	}
 
 	// Convert to MCP response format
 	content := []map[string]interface{}{
@@ -328,15 +324,9 @@ func (h *MCPToolHandler) handleUpdateNode(ctx context.Context, args map[string]i
 	}
 
 	// Parse composite ID to extract node ID
-	parts := strings.Split(compositeID, ":")
-	if len(parts) != 3 {
-		return nil, fmt.Errorf("invalid composite_id format, expected 'tool-name:domain:id'")
-	}
-
-	nodeIDStr := parts[2]
-	nodeID, err := strconv.Atoi(nodeIDStr)
+	nodeID, err := parseCompositeID(compositeID)
 	if err != nil {
-		return nil, fmt.Errorf("invalid node ID in composite_id: %v", err)
+		return nil, err
 	}
 
 	// Get existing node
@@ -344,6 +334,9 @@ func (h *MCPToolHandler) handleUpdateNode(ctx context.Context, args map[string]i
 	if err != nil {
 		return nil, fmt.Errorf("failed to get node: %w", err)
 	}
+	if node == nil {
+		return nil, fmt.Errorf("node not found: %s", compositeID)
+	}
 
 	// Update fields if provided
 	updated := false
@@ -371,16 +364,22 @@ func (h *MCPToolHandler) handleUpdateNode(ctx context.Context, args map[string]i
 	}
 
 	// Convert to MCP response format
-	return map[string]interface{}{
-		"content": []map[string]interface{}{
-			{
-				"type": "text",
-				"text": fmt.Sprintf("Successfully updated node:\nID: %d\nURL: %s\nTitle: %s\nDescription: %s\nUpdated: %s",
-					node.ID(), node.URL(), node.Title(), node.Description(),
-					node.UpdatedAt().Format("2006-01-02 15:04:05")),
-			},
-		},
-	}, nil
+	content := []map[string]interface{}{
+		createTextContent(fmt.Sprintf("Successfully updated node:\nID: %d\nURL: %s\nTitle: %s\nDescription: %s\nUpdated: %s",
+			node.ID(), node.URL(), node.Title(), node.Description(),
+			node.UpdatedAt().Format("2006-01-02 15:04:05"))),
+	}
+
+	structuredContent := map[string]interface{}{
+		"composite_id": compositeID,
+		"id":           node.ID(),
+		"url":          node.URL(),
+		"title":        node.Title(),
+		"description":  node.Description(),
+		"updated_at":   node.UpdatedAt().Format(time.RFC3339),
+	}
+
+	return createMCPResponse(content, structuredContent), nil
 }
 
 // handleDeleteNode implements the delete_node tool
@@ -392,15 +391,9 @@ func (h *MCPToolHandler) handleDeleteNode(ctx context.Context, args map[string]i
 	}
 
 	// Parse composite ID to extract node ID
-	parts := strings.Split(compositeID, ":")
-	if len(parts) != 3 {
-		return nil, fmt.Errorf("invalid composite_id format, expected 'tool-name:domain:id'")
-	}
-
-	nodeIDStr := parts[2]
-	nodeID, err := strconv.Atoi(nodeIDStr)
+	nodeID, err := parseCompositeID(compositeID)
 	if err != nil {
-		return nil, fmt.Errorf("invalid node ID in composite_id: %v", err)
+		return nil, err
 	}
 
 	// Get node before deleting (for confirmation message)
@@ -415,15 +408,20 @@ func (h *MCPToolHandler) handleDeleteNode(ctx context.Context, args map[string]i
 	}
 
 	// Convert to MCP response format
-	return map[string]interface{}{
-		"content": []map[string]interface{}{
-			{
-				"type": "text",
-				"text": fmt.Sprintf("Successfully deleted node:\nID: %d\nURL: %s\nTitle: %s",
-					node.ID(), node.URL(), node.Title()),
-			},
-		},
-	}, nil
+	content := []map[string]interface{}{
+		createTextContent(fmt.Sprintf("Successfully deleted node:\nID: %d\nURL: %s\nTitle: %s",
+			node.ID(), node.URL(), node.Title())),
+	}
+
+	structuredContent := map[string]interface{}{
+		"composite_id": compositeID,
+		"id":           node.ID(),
+		"url":          node.URL(),
+		"title":        node.Title(),
+		"deleted":      true,
+	}
+
+	return createMCPResponse(content, structuredContent), nil
 }
 
 // handleFindNodeByURL implements the find_node_by_url tool
@@ -444,18 +442,28 @@ func (h *MCPToolHandler) handleFindNodeByURL(ctx context.Context, args map[strin
 	if err != nil {
 		return nil, fmt.Errorf("failed to find node: %w", err)
 	}
+	if node == nil {
+		return nil, fmt.Errorf("node not found: %s", url)
+	}
 
 	// Convert to MCP response format
-	return map[string]interface{}{
-		"content": []map[string]interface{}{
-			{
-				"type": "text",
-				"text": fmt.Sprintf("Found node:\nID: %d\nURL: %s\nTitle: %s\nDescription: %s\nCreated: %s",
-					node.ID(), node.URL(), node.Title(), node.Description(),
-					node.CreatedAt().Format("2006-01-02 15:04:05")),
-			},
-		},
-	}, nil
+	content := []map[string]interface{}{
+		createTextContent(fmt.Sprintf("Found node:\nID: %d\nURL: %s\nTitle: %s\nDescription: %s\nCreated: %s",
+			node.ID(), node.URL(), node.Title(), node.Description(),
+			node.CreatedAt().Format("2006-01-02 15:04:05"))),
+	}
+
+	structuredContent := map[string]interface{}{
+		"composite_id": fmt.Sprintf("%s:%s:%d", constants.DefaultServerName, domainName, node.ID()),
+		"domain_name":  domainName,
+		"id":           node.ID(),
+		"url":          node.URL(),
+		"title":        node.Title(),
+		"description":  node.Description(),
+		"created_at":   node.CreatedAt().Format(time.RFC3339),
+	}
+
+	return createMCPResponse(content, structuredContent), nil
 }
 
 // Attribute Management Tools
@@ -469,15 +477,9 @@ func (h *MCPToolHandler) handleGetNodeAttributes(ctx context.Context, args map[s
 	}
 
 	// Parse composite ID to extract node ID
-	parts := strings.Split(compositeID, ":")
-	if len(parts) != 3 {
-		return nil, fmt.Errorf("invalid composite_id format, expected 'tool-name:domain:id'")
-	}
-
-	nodeIDStr := parts[2]
-	nodeID, err := strconv.Atoi(nodeIDStr)
+	nodeID, err := parseCompositeID(compositeID)
 	if err != nil {
-		return nil, fmt.Errorf("invalid node ID in composite_id: %v", err)
+		return nil, err
 	}
 
 	// Get node to ensure it exists
@@ -485,6 +487,9 @@ func (h *MCPToolHandler) handleGetNodeAttributes(ctx context.Context, args map[s
 	if err != nil {
 		return nil, fmt.Errorf("failed to get node: %w", err)
 	}
+	if node == nil {
+		return nil, fmt.Errorf("node not found: %s", compositeID)
+	}
 
 	// Get node attributes from database
 	nodeAttributes, err := h.dependencies.NodeAttributeRepo.GetByNodeID(ctx, nodeID)
@@ -493,43 +498,62 @@ func (h *MCPToolHandler) handleGetNodeAttributes(ctx context.Context, args map[s
 	}
 
 	if len(nodeAttributes) == 0 {
-		return map[string]interface{}{
-			"content": []map[string]interface{}{
-				{
-					"type": "text",
-					"text": fmt.Sprintf("No attributes found for node: %s\nURL: %s", node.Title(), node.URL()),
-				},
-			},
-			}, nil
+		content := []map[string]interface{}{
+			createTextContent(fmt.Sprintf("No attributes found for node: %s\nURL: %s", node.Title(), node.URL())),
+		}
+		structuredContent := map[string]interface{}{
+			"composite_id": compositeID,
+			"attributes":   []map[string]interface{}{},
+		}
+		return createMCPResponse(content, structuredContent), nil
 	}
 
 	// Build attributes display
-	var attributeTexts []string
+	attributeTexts := make([]string, 0, len(nodeAttributes))
+	structuredAttributes := make([]map[string]interface{}, 0, len(nodeAttributes))
 	for _, nodeAttr := range nodeAttributes {
-		// Get attribute definition to show name and type
-		attr, err := h.dependencies.AttributeRepo.GetByID(ctx, nodeAttr.AttributeID())
-		if err != nil {
-			continue // Skip if attribute definition not found
+		// Name and type are joined in by GetByNodeID; only fetch the definition if missing
+		attrName := nodeAttr.Name()
+		attrType := ""
+		if nodeAttr.AttributeType() != nil {
+			attrType = *nodeAttr.AttributeType()
+		}
+		if attrName == "" {
+			attr, err := h.dependencies.AttributeRepo.GetByID(ctx, nodeAttr.AttributeID())
+			if err != nil || attr == nil {
+				continue // Skip if attribute definition not found
+			}
+			attrName, attrType = attr.Name(), attr.Type()
 		}
 
-		text := fmt.Sprintf("• %s (%s): %s", attr.Name(), attr.Type(), nodeAttr.Value())
+		text := fmt.Sprintf("• %s (%s): %s", attrName, attrType, nodeAttr.Value())
 		if nodeAttr.OrderIndex() != nil {
 			text += fmt.Sprintf(" [order: %d]", *nodeAttr.OrderIndex())
 		}
 		attributeTexts = append(attributeTexts, text)
+
+		structuredAttribute := map[string]interface{}{
+			"name":  attrName,
+			"type":  attrType,
+			"value": nodeAttr.Value(),
+		}
+		if nodeAttr.OrderIndex() != nil {
+			structuredAttribute["order_index"] = *nodeAttr.OrderIndex()
+		}
+		structuredAttributes = append(structuredAttributes, structuredAttribute)
 	}
 
 	content := []map[string]interface{}{
-		{
-			"type": "text",
-			"text": fmt.Sprintf("Attributes for node: %s\nURL: %s\n\n%s",
-				node.Title(), node.URL(), strings.Join(attributeTexts, "\n")),
-		},
+		createTextContent(fmt.Sprintf("Attributes for node: %s\nURL: %s\n\n%s",
+			node.Title(), node.URL(), strings.Join(attributeTexts, "\n"))),
 	}
 
-	return map[string]interface{}{
-		"content": content,
-	}, nil
+	structuredContent := map[string]interface{}{
+		"composite_id": compositeID,
+		"attributes":   structuredAttributes,
+	}
+
+	return createMCPResponse(content, structuredContent), nil
 }
 
 // handleSetNodeAttributes implements the set_node_attributes tool
@@ -552,15 +576,9 @@ func (h *MCPToolHandler) handleSetNodeAttributes(ctx context.Context, args map[s
 	}
 
 	// Parse composite ID to extract node ID
-	parts := strings.Split(compositeID, ":")
-	if len(parts) != 3 {
-		return nil, fmt.Errorf("invalid composite_id format, expected 'tool-name:domain:id'")
-	}
-
-	nodeIDStr := parts[2]
-	nodeID, err := strconv.Atoi(nodeIDStr)
+	nodeID, err := parseCompositeID(compositeID)
 	if err != nil {
-		return nil, fmt.Errorf("invalid node ID in composite_id: %v", err)
+		return nil, err
 	}
 
 	// Get node to ensure it exists
@@ -568,9 +586,12 @@ func (h *MCPToolHandler) handleSetNodeAttributes(ctx context.Context, args map[s
 	if err != nil {
 		return nil, fmt.Errorf("failed to get node: %w", err)
 	}
+	if node == nil {
+		return nil, fmt.Errorf("node not found: %s", compositeID)
+	}
 
 	// Convert attributes to use case input
-	var attributeInputs []nodeUseCase.AttributeInput
+	attributeInputs := make([]nodeUseCase.AttributeInput, 0, len(attributes))
 	for _, attr := range attributes {
 		attrMap, ok := attr.(map[string]interface{})
 		if !ok {
@@ -634,6 +655,9 @@ func (h *MCPToolHandler) handleListDomainAttributes(ctx context.Context, args ma
 	if err != nil {
 		return nil, fmt.Errorf("failed to get domain: %w", err)
 	}
+	if domain == nil {
+		return nil, fmt.Errorf("domain not found: %s", domainName)
+	}
 
 	// Get attributes for this domain
 	attributes, err := h.dependencies.AttributeRepo.ListByDomainID(ctx, domain.ID())
@@ -642,7 +666,7 @@ func (h *MCPToolHandler) handleListDomainAttributes(ctx context.Context, args ma
 	}
 
 	// Convert to MCP response format
-	content := []map[string]interface{}{}
+	content := make([]map[string]interface{}, 0, len(attributes))
 	for _, attr := range attributes {
 		content = append(content, map[string]interface{}{
 			"type": "text",
@@ -692,6 +716,9 @@ func (h *MCPToolHandler) handleCreateDomainAttribute(ctx context.Context, args m
 	if err != nil {
 		return nil, fmt.Errorf("failed to get domain: %w", err)
 	}
+	if domain == nil {
+		return nil, fmt.Errorf("domain not found: %s", domainName)
+	}
 
 	// Create attribute request DTO
 	createReq := &request.CreateAttributeRequest{
@@ -720,6 +747,28 @@ func (h *MCPToolHandler) handleCreateDomainAttribute(ctx context.Context, args m
 	}, nil
 }
 
+// getDomainAttributeByName looks up a single domain attribute with one indexed query
+// instead of listing every attribute in the domain and scanning for the name
+func (h *MCPToolHandler) getDomainAttributeByName(ctx context.Context, domainName, attributeName string) (*entity.Attribute, error) {
+	domain, err := h.dependencies.DomainRepo.GetByName(ctx, domainName)
+	if err != nil {
+		return nil, fmt.Errorf("failed to get domain: %w", err)
+	}
+	if domain == nil {
+		return nil, fmt.Errorf("domain '%s' not found", domainName)
+	}
+
+	attribute, err := h.dependencies.AttributeRepo.GetByName(ctx, domain.ID(), attributeName)
+	if err != nil {
+		return nil, fmt.Errorf("failed to get domain attribute: %w", err)
+	}
+	if attribute == nil {
+		return nil, fmt.Errorf("attribute '%s' not found in domain '%s'", attributeName, domainName)
+	}
+
+	return attribute, nil
+}
+
 // handleGetDomainAttribute implements the get_domain_attribute tool
 func (h *MCPToolHandler) handleGetDomainAttribute(ctx context.Context, args map[string]interface{}) (interface{}, error) {
 	// Parse arguments
@@ -733,29 +782,9 @@ func (h *MCPToolHandler) handleGetDomainAttribute(ctx context.Context, args map[
 		return nil, fmt.Errorf("missing or invalid 'attribute_name' parameter")
 	}
 
-	// Get domain first to get domain ID
-	domain, err := h.dependencies.DomainRepo.GetByName(ctx, domainName)
-	if err != nil {
-		return nil, fmt.Errorf("failed to get domain: %w", err)
-	}
-
-	// Get all attributes for this domain and find the specific one
-	attributes, err := h.dependencies.AttributeRepo.ListByDomainID(ctx, domain.ID())
+	foundAttribute, err := h.getDomainAttributeByName(ctx, domainName, attributeName)
 	if err != nil {
-		return nil, fmt.Errorf("failed to list domain attributes: %w", err)
-	}
-
-	// Find the specific attribute
-	var foundAttribute *entity.Attribute
-	for _, attr := range attributes {
-		if attr.Name() == attributeName {
-			foundAttribute = attr
-			break
-		}
-	}
-
-	if foundAttribute == nil {
-		return nil, fmt.Errorf("attribute '%s' not found in domain '%s'", attributeName, domainName)
+		return nil, err
 	}
 
 	// Convert to MCP response format
@@ -784,29 +813,9 @@ func (h *MCPToolHandler) handleUpdateDomainAttribute(ctx context.Context, args m
 		return nil, fmt.Errorf("missing or invalid 'attribute_name' parameter")
 	}
 
-	// Get domain first to get domain ID
-	domain, err := h.dependencies.DomainRepo.GetByName(ctx, domainName)
-	if err != nil {
-		return nil, fmt.Errorf("failed to get domain: %w", err)
-	}
-
-	// Get all attributes for this domain and find the specific one
-	attributes, err := h.dependencies.AttributeRepo.ListByDomainID(ctx, domain.ID())
+	foundAttribute, err := h.getDomainAttributeByName(ctx, domainName, attributeName)
 	if err != nil {
-		return nil, fmt.Errorf("failed to list domain attributes: %w", err)
-	}
-
-	// Find the specific attribute
-	var foundAttribute *entity.Attribute
-	for _, attr := range attributes {
-		if attr.Name() == attributeName {
-			foundAttribute = attr
-			break
-		}
-	}
-
-	if foundAttribute == nil {
-		return nil, fmt.Errorf("attribute '%s' not found in domain '%s'", attributeName, domainName)
+		return nil, err
 	}
 
 	// Update description if provided
@@ -851,29 +860,9 @@ func (h *MCPToolHandler) handleDeleteDomainAttribute(ctx context.Context, args m
 		return nil, fmt.Errorf("missing or invalid 'attribute_name' parameter")
 	}
 
-	// Get domain first to get domain ID
-	domain, err := h.dependencies.DomainRepo.GetByName(ctx, domainName)
+	foundAttribute, err := h.getDomainAttributeByName(ctx, domainName, attributeName)
 	if err != nil {
-		return nil, fmt.Errorf("failed to get domain: %w", err)
-	}
-
-	// Get all attributes for this domain and find the specific one
-	attributes, err := h.dependencies.AttributeRepo.ListByDomainID(ctx, domain.ID())
-	if err != nil {
-		return nil, fmt.Errorf("failed to list domain attributes: %w", err)
-	}
-
-	// Find the specific attribute
-	var foundAttribute *entity.Attribute
-	for _, attr := range attributes {
-		if attr.Name() == attributeName {
-			foundAttribute = attr
-			break
-		}
-	}
-
-	if foundAttribute == nil {
-		return nil, fmt.Errorf("attribute '%s' not found in domain '%s'", attributeName, domainName)
+		return nil, err
 	}
 
 	// Delete the attribute
@@ -897,12 +886,12 @@ func (h *MCPToolHandler) handleDeleteDomainAttribute(ctx context.Context, args m
 
 // parseCompositeID is a helper function to parse composite IDs
 func parseCompositeID(compositeID string) (int, error) {
-	parts := strings.Split(compositeID, ":")
-	if len(parts) != 3 {
+	// Exactly two separators make three parts; the node ID follows the last one
+	if strings.Count(compositeID, ":") != 2 {
 		return 0, fmt.Errorf("invalid composite_id format, expected 'tool-name:domain:id'")
 	}
 
-	nodeID, err := strconv.Atoi(parts[2])
+	nodeID, err := strconv.Atoi(compositeID[strings.LastIndexByte(compositeID, ':')+1:])
 	if err != nil {
 		return 0, fmt.Errorf("invalid node ID in composite_id: %v", err)
 	}
@@ -973,15 +962,21 @@ func (h *MCPToolHandler) handleCreateDependency(ctx context.Context, args map[st
 		description = d
 	}
 
-	// Verify both nodes exist
-	_, err = h.dependencies.NodeRepo.GetByID(ctx, depNodeID)
+	// Verify both nodes exist with a single lookup
+	nodes, err := h.dependencies.NodeRepo.GetBatch(ctx, []int{depNodeID, depyNodeID})
 	if err != nil {
-		return nil, fmt.Errorf("dependent node not found: %w", err)
+		return nil, fmt.Errorf("failed to get nodes: %w", err)
 	}
 
-	_, err = h.dependencies.NodeRepo.GetByID(ctx, depyNodeID)
-	if err != nil {
-		return nil, fmt.Errorf("dependency node not found: %w", err)
+	found := make(map[int]bool, len(nodes))
+	for _, node := range nodes {
+		found[node.ID()] = true
+	}
+	if !found[depNodeID] {
+		return nil, fmt.Errorf("dependent node not found: %s", dependentNodeID)
+	}
+	if !found[depyNodeID] {
+		return nil, fmt.Errorf("dependency node not found: %s", dependencyNodeID)
 	}
 
 	// TODO: Use a proper dependency repository when available
@@ -1016,6 +1011,9 @@ func (h *MCPToolHandler) handleListNodeDependencies(ctx context.Context, args ma
 	if err != nil {
 		return nil, fmt.Errorf("node not found: %w", err)
 	}
+	if node == nil {
+		return nil, fmt.Errorf("node not found: %s", compositeID)
+	}
 
 	// TODO: Query dependencies from database when repository is available
 	// For now, return placeholder response
@@ -1049,6 +1047,9 @@ func (h *MCPToolHandler) handleListNodeDependents(ctx context.Context, args map[
 	if err != nil {
 		return nil, fmt.Errorf("node not found: %w", err)
 	}
+	if node == nil {
+		return nil, fmt.Errorf("node not found: %s", compositeID)
+	}
 
 	// TODO: Query dependents from database when repository is available
 	// For now, return placeholder response
@@ -1124,7 +1125,7 @@ func (h *MCPToolHandler) handleFilterNodesByAttributes(ctx context.Context, args
 	}
 
 	// Convert filters to repository format
-	var filters []repository.AttributeFilter
+	filters := make([]repository.AttributeFilter, 0, len(filtersArray))
 	for i, filterRaw := range filtersArray {
 		filterMap, ok := filterRaw.(map[string]interface{})
 		if !ok {
@@ -1171,7 +1172,8 @@ func (h *MCPToolHandler) handleFilterNodesByAttributes(ctx context.Context, args
 	}
 
 	// Convert to MCP response format
-	content := []map[string]interface{}{}
+	// One entry per node plus an optional pagination line
+	content := make([]map[string]interface{}, 0, len(result.Nodes)+1)
 
 	if len(result.Nodes) == 0 {
 		content = append(content, map[string]interface{}{
@@ -1210,15 +1212,9 @@ func (h *MCPToolHandler) handleGetNodeWithAttributes(ctx context.Context, args m
 	}
 
 	// Parse composite ID to extract node ID
-	parts := strings.Split(compositeID, ":")
-	if len(parts) != 3 {
-		return nil, fmt.Errorf("invalid composite_id format, expected 'tool-name:domain:id'")
-	}
-
-	nodeIDStr := parts[2]
-	nodeID, err := strconv.Atoi(nodeIDStr)
+	nodeID, err := parseCompositeID(compositeID)
 	if err != nil {
-		return nil, fmt.Errorf("invalid node ID in composite_id: %v", err)
+		return nil, err
 	}
 
 	// Execute use case
@@ -1231,35 +1227,54 @@ func (h *MCPToolHandler) handleGetNodeWithAttributes(ctx context.Context, args m
 	var responseText strings.Builder
 
 	// Node information
-	responseText.WriteString(fmt.Sprintf("Node: %s\n", result.Node.Title))
-	responseText.WriteString(fmt.Sprintf("URL: %s\n", result.Node.URL))
-	responseText.WriteString(fmt.Sprintf("Description: %s\n", result.Node.Description))
-	responseText.WriteString(fmt.Sprintf("Domain: %s\n", result.Node.DomainName))
-	responseText.WriteString(fmt.Sprintf("Created: %s\n", result.Node.CreatedAt.Format("2006-01-02 15:04:05")))
-	responseText.WriteString(fmt.Sprintf("Updated: %s\n", result.Node.UpdatedAt.Format("2006-01-02 15:04:05")))
+	fmt.Fprintf(&responseText, "Node: %s\n", result.Node.Title)
+	fmt.Fprintf(&responseText, "URL: %s\n", result.Node.URL)
+	fmt.Fprintf(&responseText, "Description: %s\n", result.Node.Description)
+	fmt.Fprintf(&responseText, "Domain: %s\n", result.Node.DomainName)
+	fmt.Fprintf(&responseText, "Created: %s\n", result.Node.CreatedAt.Format("2006-01-02 15:04:05"))
+	fmt.Fprintf(&responseText, "Updated: %s\n", result.Node.UpdatedAt.Format("2006-01-02 15:04:05"))
 
 	// Attributes information
+	structuredAttributes := make([]map[string]interface{}, 0, len(result.Attributes))
 	if len(result.Attributes) > 0 {
 		responseText.WriteString("\nAttributes:\n")
 		for _, attr := range result.Attributes {
 			attrText := fmt.Sprintf("• %s (%s): %s", attr.AttributeName, attr.AttributeType, attr.Value)
+			structuredAttribute := map[string]interface{}{
+				"name":  attr.AttributeName,
+				"type":  attr.AttributeType,
+				"value": attr.Value,
+			}
 			if attr.OrderIndex != nil {
 				attrText += fmt.Sprintf(" [order: %d]", *attr.OrderIndex)
+				structuredAttribute["order_index"] = *attr.OrderIndex
 			}
 			responseText.WriteString(attrText + "\n")
+			structuredAttributes = append(structuredAttributes, structuredAttribute)
 		}
 	} else {
 		responseText.WriteString("\nNo attributes found for this node.\n")
 	}
 
-	return map[string]interface{}{
-		"content": []map[string]interface{}{
-			{
-				"type": "text",
-				"text": responseText.String(),
-			},
-		},
-	}, nil
+	content := []map[string]interface{}{
+		createTextContent(responseText.String()),
+	}
+
+	// The structured form carries everything get_node and get_node_attributes return,
+	// so a client can read a node and its attributes with this single call
+	structuredContent := map[string]interface{}{
+		"composite_id": compositeID,
+		"id":           result.Node.ID,
+		"url":          result.Node.URL,
+		"domain_name":  result.Node.DomainName,
+		"title":        result.Node.Title,
+		"description":  result.Node.Description,
+		"created_at":   result.Node.CreatedAt.Format(time.RFC3339),
+		"updated_at":   result.Node.UpdatedAt.Format(time.RFC3339),
+		"attributes":   structuredAttributes,
+	}
+
+	return createMCPResponse(content, structuredContent), nil
 }
 
 // Template Management Tools
@@ -1309,7 +1324,7 @@ func (h *MCPToolHandler) handleListTemplates(ctx context.Context, args map[strin
 	}
 
 	// Convert to MCP response format
-	content := []map[string]interface{}{}
+	content := make([]map[string]interface{}, 0, len(templates))
 	for _, template := range templates {
 		templateType, _ := template.GetTemplateType()
 		templateVersion, _ := template.GetTemplateVersion()
@@ -1657,9 +1672,9 @@ func (h *MCPToolHandler) handleValidateTemplate(ctx context.Context, args map[st
 	}
 
 	if result.Valid {
-		// Extract type and version for additional info
-		templateType, _ := h.dependencies.TemplateService.ExtractTemplateType(templateData)
-		templateVersion, _ := h.dependencies.TemplateService.ExtractTemplateVersion(templateData)
+		// Type and version come from the validation pass; no need to parse the data again
+		templateType := result.Type
+		templateVersion := result.Version
 
 		return map[string]interface{}{
 			"content": []map[string]interface{}{
@@ -1675,9 +1690,9 @@ func (h *MCPToolHandler) handleValidateTemplate(ctx context.Context, args map[st
 		var errorText strings.Builder
 		errorText.WriteString("❌ Template validation failed!\n\nErrors:\n")
 		for i, validationError := range result.Errors {
-			errorText.WriteString(fmt.Sprintf("%d. Path: %s - %s", i+1, validationError.Path, validationError.Message))
+			fmt.Fprintf(&errorText, "%d. Path: %s - %s", i+1, validationError.Path, validationError.Message)
 			if validationError.Value != nil {
-				errorText.WriteString(fmt.Sprintf(" (value: %v)", validationError.Value))
+				fmt.Fprintf(&errorText, " (value: %v)", validationError.Value)
 			}
 			errorText.WriteString("\n")
 		}
@@ -1706,16 +1721,16 @@ func formatTemplateList(templates []map[string]interface{}) string {
 		if i > 0 {
 			result.WriteString("\n")
 		}
-		result.WriteString(fmt.Sprintf("%d. %s (%s)\n", i+1, template["name"], template["composite_id"]))
-		result.WriteString(fmt.Sprintf("   Type: %s | Version: %s | Status: %s\n",
-			template["type"], template["version"], getTemplateStatus(template["is_active"].(bool))))
+		fmt.Fprintf(&result, "%d. %s (%s)\n", i+1, template["name"], template["composite_id"])
+		fmt.Fprintf(&result, "   Type: %s | Version: %s | Status: %s\n",
+			template["type"], template["version"], getTemplateStatus(template["is_active"].(bool)))
 		if title, ok := template["title"].(string); ok && title != "" {
-			result.WriteString(fmt.Sprintf("   Title: %s\n", title))
+			fmt.Fprintf(&result, "   Title: %s\n", title)
 		}
 		if description, ok := template["description"].(string); ok && description != "" {
-			result.WriteString(fmt.Sprintf("   Description: %s\n", description))
+			fmt.Fprintf(&result, "   Description: %s\n", description)
 		}
-		result.WriteString(fmt.Sprintf("   Updated: %s", template["updated_at"]))
+		fmt.Fprintf(&result, "   Updated: %s", template["updated_at"])
 	}
 	return result.String()
 }
@@ -1798,11 +1813,11 @@ func (h *MCPToolHandler) handleScanAllContent(ctx context.Context, args map[stri
 func formatScanResult(result *service.ScanResponse) string {
 	var text strings.Builder
 	
-	text.WriteString(fmt.Sprintf("📊 **Content Scan Results**\n\n"))
-	text.WriteString(fmt.Sprintf("**Page**: %d/%d (%d tokens)\n", 
-		result.Pagination.CurrentPage, result.Pagination.TotalPages, result.Pagination.CurrentTokens))
-	text.WriteString(fmt.Sprintf("**Items**: %d/%d nodes\n", 
-		result.Metadata.ProcessedNodes, result.Metadata.TotalNodes))
+	text.WriteString("📊 **Content Scan Results**\n\n")
+	fmt.Fprintf(&text, "**Page**: %d/%d (%d tokens)\n", 
+		result.Pagination.CurrentPage, result.Pagination.TotalPages, result.Pagination.CurrentTokens)
+	fmt.Fprintf(&text, "**Items**: %d/%d nodes\n", 
+		result.Metadata.ProcessedNodes, result.Metadata.TotalNodes)
 	
 	// Navigation info
 	navInfo := []string{}
@@ -1813,37 +1828,37 @@ func formatScanResult(result *service.ScanResponse) string {
 		navInfo = append(navInfo, fmt.Sprintf("Page %d →", result.Pagination.CurrentPage+1))
 	}
 	if len(navInfo) > 0 {
-		text.WriteString(fmt.Sprintf("**Navigation**: %s\n", strings.Join(navInfo, " | ")))
+		fmt.Fprintf(&text, "**Navigation**: %s\n", strings.Join(navInfo, " | "))
 	}
 	
 	// Compression info
 	if result.Metadata.CompressedOutput && result.Metadata.AttributeSummary != nil {
 		summary := result.Metadata.AttributeSummary
-		text.WriteString(fmt.Sprintf("**Compression**: %d duplicates removed", summary.TotalDuplicatesRemoved))
+		fmt.Fprintf(&text, "**Compression**: %d duplicates removed", summary.TotalDuplicatesRemoved)
 		if len(summary.UniqueValues) > 0 {
-			text.WriteString(fmt.Sprintf(" (%d unique attribute types)", len(summary.UniqueValues)))
+			fmt.Fprintf(&text, " (%d unique attribute types)", len(summary.UniqueValues))
 		}
 		text.WriteString("\n")
 	}
 	
-	text.WriteString(fmt.Sprintf("\n**Current Page Items (%d)**:\n", len(result.Items)))
+	fmt.Fprintf(&text, "\n**Current Page Items (%d)**:\n", len(result.Items))
 	
 	for i, item := range result.Items {
 		if i >= 10 { // Limit display for readability
-			text.WriteString(fmt.Sprintf("... and %d more items (use page %d to see more)\n", len(result.Items)-10, result.Pagination.CurrentPage+1))
+			fmt.Fprintf(&text, "... and %d more items (use page %d to see more)\n", len(result.Items)-10, result.Pagination.CurrentPage+1)
 			break
 		}
 		
-		text.WriteString(fmt.Sprintf("\n%d. **%s**", i+1, item.Content))
+		fmt.Fprintf(&text, "\n%d. **%s**", i+1, item.Content)
 		if item.Title != nil && *item.Title != "" {
-			text.WriteString(fmt.Sprintf(" - *%s*", *item.Title))
+			fmt.Fprintf(&text, " - *%s*", *item.Title)
 		}
 		
 		if len(item.Attributes) > 0 {
 			if result.Metadata.CompressedOutput {
-				text.WriteString(fmt.Sprintf(" [%d unique attrs]", len(item.Attributes)))
+				fmt.Fprintf(&text, " [%d unique attrs]", len(item.Attributes))
 			} else {
-				text.WriteString(fmt.Sprintf(" [%d attributes]", len(item.Attributes)))
+				fmt.Fprintf(&text, " [%d attributes]", len(item.Attributes))
 			}
 		}
 	}
@@ -1852,10 +1867,10 @@ func formatScanResult(result *service.ScanResponse) string {
 	if result.Metadata.CompressedOutput && result.Metadata.AttributeSummary != nil {
 		summary := result.Metadata.AttributeSummary
 		if len(summary.MostCommonValues) > 0 {
-			text.WriteString(fmt.Sprintf("\n\n**Most Common Values**:\n"))
+			text.WriteString("\n\n**Most Common Values**:\n")
 			for attrName, value := range summary.MostCommonValues {
 				count := summary.ValueCounts[attrName+":"+value]
-				text.WriteString(fmt.Sprintf("- %s: '%s' (%d times)\n", attrName, value, count))
+				fmt.Fprintf(&text, "- %s: '%s' (%d times)\n", attrName, value, count)
 			}
 		}
 	}
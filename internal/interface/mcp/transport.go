@@ -2,7 +2,16 @@ package mcp
 
 import (
 	"context"
+	"encoding/json"
+	"errors"
+	"fmt"
 	"io"
+	"net"
+	"net/http"
+	"sync"
+	"time"
+
+	"url-db/internal/constants"
 )
 
 // Transport represents different communication transports for MCP server
@@ -28,6 +37,8 @@ type ResponseWriter interface {
 	WriteResponse(response *JSONRPCResponse) error
 	// WriteError writes an error response with the specified parameters
 	WriteError(id interface{}, code int, message string, data interface{}) error
+	// WriteBatch writes the responses to a JSON-RPC batch as a single array
+	WriteBatch(responses []*JSONRPCResponse) error
 	// GetWriter returns the underlying io.Writer (for backward compatibility)
 	GetWriter() io.Writer
 }
@@ -39,3 +50,169 @@ type TransportConfig struct {
 	Reader io.Reader
 	Writer io.Writer
 }
+
+// Timeouts for the HTTP-based transports. Keep-alive connections are reused across
+// requests and only closed after sitting idle; no write timeout is set so that long
+// SSE responses are not cut off.
+const (
+	httpReadHeaderTimeout = 10 * time.Second
+	httpIdleTimeout       = 120 * time.Second
+)
+
+// newHTTPServer creates the http.Server shared by the HTTP and SSE transports
+func newHTTPServer(port string, handler http.Handler) *http.Server {
+	return &http.Server{
+		Addr:              ":" + port,
+		Handler:           handler,
+		ReadHeaderTimeout: httpReadHeaderTimeout,
+		IdleTimeout:       httpIdleTimeout,
+	}
+}
+
+// serveHTTP serves on listener until the server fails or ctx is cancelled. Cancellation
+// shuts the server down gracefully and serveHTTP returns only once in-flight requests
+// have finished, so the caller can release the database afterwards. A server closed by
+// cancellation or by Stop is not reported as an error.
+func serveHTTP(ctx context.Context, server *http.Server, listener net.Listener) error {
+	stopped := make(chan struct{})
+	shutdownDone := make(chan error, 1)
+	go func() {
+		select {
+		case <-ctx.Done():
+			shutdownDone <- server.Shutdown(context.Background())
+		case <-stopped:
+			shutdownDone <- nil
+		}
+	}()
+
+	err := server.Serve(listener)
+	close(stopped)
+	if !errors.Is(err, http.ErrServerClosed) {
+		return err
+	}
+	return <-shutdownDone
+}
+
+// maxBatchWorkers bounds how many requests of a single batch are handled concurrently
+const maxBatchWorkers = 4
+
+// newJSONEncoder creates the encoder used for JSON-RPC responses. HTML escaping is
+// disabled: responses are never embedded in HTML, and URLs in tool results are full of
+// '&' characters that would otherwise be rewritten as \u0026 on every encode.
+func newJSONEncoder(w io.Writer) *json.Encoder {
+	encoder := json.NewEncoder(w)
+	encoder.SetEscapeHTML(false)
+	return encoder
+}
+
+// newErrorResponse builds a JSON-RPC error response; shared by the protocol handler,
+// the batch dispatcher and every ResponseWriter's WriteError
+func newErrorResponse(id interface{}, code int, message string, data interface{}) *JSONRPCResponse {
+	return &JSONRPCResponse{
+		JSONRPC: constants.JSONRPCVersion,
+		ID:      id,
+		Error: &RPCError{
+			Code:    code,
+			Message: message,
+			Data:    data,
+		},
+	}
+}
+
+// healthCheckHandler returns the /health handler shared by the network transports. The
+// body never changes for a given mode, so it is encoded once rather than per probe.
+func healthCheckHandler(mode string) http.HandlerFunc {
+	body, _ := json.Marshal(map[string]interface{}{
+		"status": "ok",
+		"mode":   mode,
+		"server": constants.MCPServerName,
+	})
+	body = append(body, '\n')
+
+	return func(w http.ResponseWriter, r *http.Request) {
+		w.Header().Set("Content-Type", "application/json")
+		w.WriteHeader(http.StatusOK)
+		w.Write(body)
+	}
+}
+
+// isBatchMessage reports whether a raw JSON-RPC message is a batch (JSON array)
+func isBatchMessage(data []byte) bool {
+	for _, c := range data {
+		switch c {
+		case ' ', '\t', '\r', '\n':
+			continue
+		case '[':
+			return true
+		default:
+			return false
+		}
+	}
+	return false
+}
+
+// dispatchMessage handles a raw JSON-RPC message, either a single request or a batch,
+// and writes any resulting responses. Notifications produce no output; a batch made up
+// only of notifications writes nothing at all.
+func dispatchMessage(ctx context.Context, handler RequestHandler, writer ResponseWriter, data []byte) error {
+	if !isBatchMessage(data) {
+		var req JSONRPCRequest
+		if err := json.Unmarshal(data, &req); err != nil {
+			return writer.WriteError(nil, ParseError, "Parse error", err.Error())
+		}
+		if response := handler(ctx, &req); response != nil {
+			return writer.WriteResponse(response)
+		}
+		return nil
+	}
+
+	var items []json.RawMessage
+	if err := json.Unmarshal(data, &items); err != nil {
+		return writer.WriteError(nil, ParseError, "Parse error", err.Error())
+	}
+	if len(items) == 0 {
+		return writer.WriteError(nil, InvalidRequest, "Invalid Request", "empty batch")
+	}
+
+	// Batch entries are independent (JSON-RPC 2.0 allows them to be processed in any
+	// order), so they are handled by a bounded pool of workers. Responses keep the
+	// order of the requests; clients needing sequential effects send separate messages.
+	results := make([]*JSONRPCResponse, len(items))
+	workers := make(chan struct{}, maxBatchWorkers)
+	var wg sync.WaitGroup
+	for i, item := range items {
+		var req JSONRPCRequest
+		if err := json.Unmarshal(item, &req); err != nil {
+			results[i] = newErrorResponse(nil, InvalidRequest, "Invalid Request", err.Error())
+			continue
+		}
+
+		wg.Add(1)
+		workers <- struct{}{}
+		go func(i int, req *JSONRPCRequest) {
+			defer wg.Done()
+			defer func() { <-workers }()
+			// A panic here would not be caught by net/http and would take down the whole
+			// process, so it is turned into an error response for this entry
+			defer func() {
+				if r := recover(); r != nil {
+					results[i] = newErrorResponse(req.ID, InternalError, "Internal error", fmt.Sprint(r))
+				}
+			}()
+			results[i] = handler(ctx, req)
+		}(i, &req)
+	}
+	wg.Wait()
+
+	responses := make([]*JSONRPCResponse, 0, len(results))
+	for _, response := range results {
+		if response != nil {
+			responses = append(responses, response)
+		}
+	}
+
+	if len(responses) == 0 {
+		return nil
+	}
+	return writer.WriteBatch(responses)
+}
@@ -2,9 +2,9 @@ package mcp
 
 import (
 	"context"
-	"encoding/json"
 	"fmt"
 	"io"
+	"net"
 	"net/http"
 	"strconv"
 
@@ -42,18 +42,22 @@ func (t *HTTPTransport) Start(ctx context.Context) error {
 	mux.HandleFunc("/mcp", t.handleHTTPEndpoint)
 
 	// Health check endpoint
-	mux.HandleFunc("/health", t.handleHealthCheck)
+	mux.HandleFunc("/health", healthCheckHandler(constants.MCPModeHTTP))
 
-	t.server = &http.Server{
-		Addr:    ":" + t.port,
-		Handler: mux,
+	t.server = newHTTPServer(t.port, mux)
+
+	// Bind before announcing, so the startup lines double as a readiness signal:
+	// once they are printed the port already accepts connections
+	listener, err := net.Listen("tcp", t.server.Addr)
+	if err != nil {
+		return fmt.Errorf("failed to listen on port %s: %w", t.port, err)
 	}
 
 	fmt.Printf("Starting MCP HTTP server on port %s\n", t.port)
 	fmt.Printf("MCP endpoint: http://localhost:%s/mcp\n", t.port)
 	fmt.Printf("Health check: http://localhost:%s/health\n", t.port)
 
-	return t.server.ListenAndServe()
+	return serveHTTP(ctx, t.server, listener)
 }
 
 // Stop gracefully shuts down the transport
@@ -98,34 +102,24 @@ func (t *HTTPTransport) handleHTTPEndpoint(w http.ResponseWriter, r *http.Reques
 	t.setCORSHeaders(w)
 	w.Header().Set("Content-Type", "application/json")
 
-	// Read and parse the JSON-RPC request
-	var req JSONRPCRequest
-	if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
-		responseWriter := NewHTTPResponseWriter(w)
+	responseWriter := NewHTTPResponseWriter(w)
+
+	// Read the JSON-RPC message, which may be a single request or a batch
+	body, err := io.ReadAll(r.Body)
+	if err != nil {
 		responseWriter.WriteError(nil, ParseError, "Parse error", err.Error())
 		return
 	}
 
-	// Create response writer and handle the request
-	responseWriter := NewHTTPResponseWriter(w)
-	response := t.requestHandler(r.Context(), &req)
-
-	if response != nil {
-		if err := responseWriter.WriteResponse(response); err != nil {
-			http.Error(w, "Failed to write response", http.StatusInternalServerError)
-		}
+	if err := dispatchMessage(r.Context(), t.requestHandler, responseWriter, body); err != nil {
+		http.Error(w, "Failed to write response", http.StatusInternalServerError)
+		return
 	}
-}
 
-// handleHealthCheck handles health check requests
-func (t *HTTPTransport) handleHealthCheck(w http.ResponseWriter, r *http.Request) {
-	w.Header().Set("Content-Type", "application/json")
-	w.WriteHeader(http.StatusOK)
-	json.NewEncoder(w).Encode(map[string]interface{}{
-		"status": "ok",
-		"mode":   "http",
-		"server": constants.MCPServerName,
-	})
+	// Notifications (and batches of only notifications) have no response body
+	if !responseWriter.written {
+		w.WriteHeader(http.StatusAccepted)
+	}
 }
 
 // setCORSHeaders sets Cross-Origin Resource Sharing headers
@@ -138,6 +132,7 @@ func (t *HTTPTransport) setCORSHeaders(w http.ResponseWriter) {
 // HTTPResponseWriter implements ResponseWriter for HTTP
 type HTTPResponseWriter struct {
 	responseWriter http.ResponseWriter
+	written        bool
 }
 
 // NewHTTPResponseWriter creates a new HTTP response writer
@@ -149,22 +144,21 @@ func NewHTTPResponseWriter(w http.ResponseWriter) *HTTPResponseWriter {
 
 // WriteResponse writes a JSON-RPC response to HTTP response
 func (w *HTTPResponseWriter) WriteResponse(response *JSONRPCResponse) error {
+	w.written = true
+	w.responseWriter.Header().Set("Content-Type", "application/json")
+	return newJSONEncoder(w.responseWriter).Encode(response)
+}
+
+// WriteBatch writes a JSON-RPC batch response to HTTP response
+func (w *HTTPResponseWriter) WriteBatch(responses []*JSONRPCResponse) error {
+	w.written = true
 	w.responseWriter.Header().Set("Content-Type", "application/json")
-	return json.NewEncoder(w.responseWriter).Encode(response)
+	return newJSONEncoder(w.responseWriter).Encode(responses)
 }
 
 // WriteError writes an error response to HTTP response
 func (w *HTTPResponseWriter) WriteError(id interface{}, code int, message string, data interface{}) error {
-	response := &JSONRPCResponse{
-		JSONRPC: constants.JSONRPCVersion,
-		ID:      id,
-		Error: &RPCError{
-			Code:    code,
-			Message: message,
-			Data:    data,
-		},
-	}
-	return w.WriteResponse(response)
+	return w.WriteResponse(newErrorResponse(id, code, message, data))
 }
 
 // GetWriter returns the underlying http.ResponseWriter as io.Writer
@@ -1,10 +1,11 @@
 package mcp
 
 import (
+	"bytes"
 	"context"
-	"encoding/json"
 	"fmt"
 	"io"
+	"net"
 	"net/http"
 	"strconv"
 
@@ -42,18 +43,22 @@ func (t *SSETransport) Start(ctx context.Context) error {
 	mux.HandleFunc("/mcp", t.handleSSEEndpoint)
 
 	// Health check endpoint
-	mux.HandleFunc("/health", t.handleHealthCheck)
+	mux.HandleFunc("/health", healthCheckHandler(constants.MCPModeSSE))
 
-	t.server = &http.Server{
-		Addr:    ":" + t.port,
-		Handler: mux,
+	t.server = newHTTPServer(t.port, mux)
+
+	// Bind before announcing, so the startup lines double as a readiness signal:
+	// once they are printed the port already accepts connections
+	listener, err := net.Listen("tcp", t.server.Addr)
+	if err != nil {
+		return fmt.Errorf("failed to listen on port %s: %w", t.port, err)
 	}
 
 	fmt.Printf("Starting MCP SSE server on port %s\n", t.port)
 	fmt.Printf("SSE endpoint: http://localhost:%s/mcp\n", t.port)
 	fmt.Printf("Health check: http://localhost:%s/health\n", t.port)
 
-	return t.server.ListenAndServe()
+	return serveHTTP(ctx, t.server, listener)
 }
 
 // Stop gracefully shuts down the transport
@@ -97,33 +102,21 @@ func (t *SSETransport) handleSSEEndpoint(w http.ResponseWriter, r *http.Request)
 	// Set SSE headers
 	t.setSSEHeaders(w)
 
-	// Read the initial JSON-RPC request
-	var req JSONRPCRequest
-	if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
-		http.Error(w, "Invalid JSON", http.StatusBadRequest)
-		return
-	}
-
-	// Create SSE response writer and handle the request
+	// Create SSE response writer; a batch is answered with a single event carrying the
+	// array of responses
 	responseWriter := NewSSEResponseWriter(w)
-	response := t.requestHandler(r.Context(), &req)
 
-	if response != nil {
-		if err := responseWriter.WriteResponse(response); err != nil {
-			fmt.Printf("Failed to send SSE response: %v\n", err)
-		}
+	// Read the JSON-RPC message, which may be a single request or a batch. Malformed
+	// JSON is answered by dispatchMessage with a Parse error response.
+	body, err := io.ReadAll(r.Body)
+	if err != nil {
+		responseWriter.WriteError(nil, ParseError, "Parse error", err.Error())
+		return
 	}
-}
 
-// handleHealthCheck handles health check requests
-func (t *SSETransport) handleHealthCheck(w http.ResponseWriter, r *http.Request) {
-	w.Header().Set("Content-Type", "application/json")
-	w.WriteHeader(http.StatusOK)
-	json.NewEncoder(w).Encode(map[string]interface{}{
-		"status": "ok",
-		"mode":   "sse",
-		"server": constants.MCPServerName,
-	})
+	if err := dispatchMessage(r.Context(), t.requestHandler, responseWriter, body); err != nil {
+		fmt.Printf("Failed to send SSE response: %v\n", err)
+	}
 }
 
 // setSSEHeaders sets Server-Sent Events headers
@@ -149,13 +142,30 @@ func NewSSEResponseWriter(w http.ResponseWriter) *SSEResponseWriter {
 
 // WriteResponse writes a JSON-RPC response via SSE
 func (w *SSEResponseWriter) WriteResponse(response *JSONRPCResponse) error {
-	data, err := json.Marshal(response)
-	if err != nil {
+	return w.writeEvent(response)
+}
+
+// WriteBatch writes a JSON-RPC batch response as a single SSE message
+func (w *SSEResponseWriter) WriteBatch(responses []*JSONRPCResponse) error {
+	return w.writeEvent(responses)
+}
+
+// writeEvent encodes a payload as one SSE message. The whole frame is built before
+// anything is written, so a payload that fails to encode leaves the stream untouched
+// instead of ending it with a partial, unterminated frame.
+func (w *SSEResponseWriter) writeEvent(payload interface{}) error {
+	var buf bytes.Buffer
+	buf.WriteString("data: ")
+	// Encode terminates the JSON with a newline; one more ends the event
+	if err := newJSONEncoder(&buf).Encode(payload); err != nil {
+		return err
+	}
+	buf.WriteByte('\n')
+
+	if _, err := w.responseWriter.Write(buf.Bytes()); err != nil {
 		return err
 	}
 
-	// Send SSE message
-	fmt.Fprintf(w.responseWriter, "data: %s\n\n", data)
 	if f, ok := w.responseWriter.(http.Flusher); ok {
 		f.Flush()
 	}
@@ -164,16 +174,7 @@ func (w *SSEResponseWriter) WriteResponse(response *JSONRPCResponse) error {
 
 // WriteError writes an error response via SSE
 func (w *SSEResponseWriter) WriteError(id interface{}, code int, message string, data interface{}) error {
-	response := &JSONRPCResponse{
-		JSONRPC: constants.JSONRPCVersion,
-		ID:      id,
-		Error: &RPCError{
-			Code:    code,
-			Message: message,
-			Data:    data,
-		},
-	}
-	return w.WriteResponse(response)
+	return w.WriteResponse(newErrorResponse(id, code, message, data))
 }
 
 // GetWriter returns a custom writer that formats data for SSE
@@ -0,0 +1,32 @@
+package mcp
+
+import (
+	"net/http/httptest"
+	"testing"
+)
+
+func TestSSEResponseWriter_WriteResponse(t *testing.T) {
+	rec := httptest.NewRecorder()
+	writer := NewSSEResponseWriter(rec)
+
+	if err := writer.WriteResponse(&JSONRPCResponse{JSONRPC: "2.0", ID: 1, Result: "ok"}); err != nil {
+		t.Fatalf("WriteResponse returned error: %v", err)
+	}
+	expected := "data: {\"jsonrpc\":\"2.0\",\"id\":1,\"result\":\"ok\"}\n\n"
+	if got := rec.Body.String(); got != expected {
+		t.Errorf("body = %q, expected %q", got, expected)
+	}
+}
+
+func TestSSEResponseWriter_EncodeFailureWritesNothing(t *testing.T) {
+	rec := httptest.NewRecorder()
+	writer := NewSSEResponseWriter(rec)
+
+	// Channels cannot be encoded as JSON
+	if err := writer.WriteResponse(&JSONRPCResponse{JSONRPC: "2.0", ID: 1, Result: make(chan int)}); err == nil {
+		t.Fatal("WriteResponse succeeded for an unencodable result")
+	}
+	if rec.Body.Len() != 0 {
+		t.Errorf("body = %q, expected nothing to be written", rec.Body.String())
+	}
+}
@@ -1,6 +1,8 @@
 package mcp
 
 import (
+	"bufio"
+	"bytes"
 	"context"
 	"encoding/json"
 	"fmt"
@@ -35,34 +37,81 @@ func NewStdioTransport(config *TransportConfig) *StdioTransport {
 	}
 }
 
+const (
+	// stdioReadAhead is the number of messages buffered ahead of the dispatcher
+	stdioReadAhead = 16
+	// stdioReadBufferSize is the size of the buffered reader wrapped around stdin
+	stdioReadBufferSize = 64 * 1024
+)
+
+// stdioMessage carries a raw message or a read error from the stdin reader goroutine
+type stdioMessage struct {
+	data json.RawMessage
+	err  error
+}
+
 // Start begins stdio communication
 func (t *StdioTransport) Start(ctx context.Context) error {
 	if t.requestHandler == nil {
 		return fmt.Errorf("request handler not set")
 	}
 
-	decoder := json.NewDecoder(t.reader)
+	// Cancelling on return releases the reader goroutine if Start exits early
+	ctx, cancel := context.WithCancel(ctx)
+	defer cancel()
+
+	messages := make(chan stdioMessage, stdioReadAhead)
+	go t.readMessages(ctx, messages)
 
 	for {
 		select {
 		case <-ctx.Done():
 			return ctx.Err()
-		default:
-			var req JSONRPCRequest
-			if err := decoder.Decode(&req); err != nil {
-				if err == io.EOF {
-					return nil
-				}
-				t.writer.WriteError(nil, ParseError, "Parse error", err.Error())
-				continue
+		case msg, ok := <-messages:
+			if !ok {
+				return nil
+			}
+			if msg.err != nil {
+				return fmt.Errorf("failed to read from stdin: %w", msg.err)
+			}
+
+			// A failed write means stdout is gone (the client exited or closed the pipe);
+			// stop instead of handling requests whose responses can never be delivered
+			if err := dispatchMessage(ctx, t.requestHandler, t.writer, msg.data); err != nil {
+				return fmt.Errorf("failed to write to stdout: %w", err)
+			}
+		}
+	}
+}
+
+// readMessages reads newline-delimited messages from stdin in the background so that
+// reading the next request overlaps with handling the current one, and so that Start can
+// observe context cancellation instead of blocking on a read. Stdin is read through a
+// large buffer and each line is handed over as-is; malformed lines are rejected later by
+// dispatchMessage without affecting the lines that follow. The channel is closed on EOF.
+func (t *StdioTransport) readMessages(ctx context.Context, messages chan<- stdioMessage) {
+	defer close(messages)
+
+	reader := bufio.NewReaderSize(t.reader, stdioReadBufferSize)
+	for {
+		line, err := reader.ReadBytes('\n')
+		if len(bytes.TrimSpace(line)) > 0 {
+			select {
+			case messages <- stdioMessage{data: line}:
+			case <-ctx.Done():
+				return
 			}
+		}
 
-			response := t.requestHandler(ctx, &req)
-			if response != nil {
-				if err := t.writer.WriteResponse(response); err != nil {
-					fmt.Fprintf(os.Stderr, "Failed to send response: %v\n", err)
-				}
+		if err == io.EOF {
+			return
+		}
+		if err != nil {
+			select {
+			case messages <- stdioMessage{err: err}:
+			case <-ctx.Done():
 			}
+			return
 		}
 	}
 }
@@ -90,34 +139,31 @@ func (t *StdioTransport) GetName() string {
 
 // StdioResponseWriter implements ResponseWriter for stdio
 type StdioResponseWriter struct {
-	writer io.Writer
+	writer  io.Writer
+	encoder *json.Encoder
 }
 
 // NewStdioResponseWriter creates a new stdio response writer
 func NewStdioResponseWriter(writer io.Writer) *StdioResponseWriter {
 	return &StdioResponseWriter{
-		writer: writer,
+		writer:  writer,
+		encoder: newJSONEncoder(writer),
 	}
 }
 
 // WriteResponse writes a JSON-RPC response to stdout
 func (w *StdioResponseWriter) WriteResponse(response *JSONRPCResponse) error {
-	encoder := json.NewEncoder(w.writer)
-	return encoder.Encode(response)
+	return w.encoder.Encode(response)
+}
+
+// WriteBatch writes a JSON-RPC batch response to stdout
+func (w *StdioResponseWriter) WriteBatch(responses []*JSONRPCResponse) error {
+	return w.encoder.Encode(responses)
 }
 
 // WriteError writes an error response to stdout
 func (w *StdioResponseWriter) WriteError(id interface{}, code int, message string, data interface{}) error {
-	response := &JSONRPCResponse{
-		JSONRPC: constants.JSONRPCVersion,
-		ID:      id,
-		Error: &RPCError{
-			Code:    code,
-			Message: message,
-			Data:    data,
-		},
-	}
-	return w.WriteResponse(response)
+	return w.WriteResponse(newErrorResponse(id, code, message, data))
 }
 
 // GetWriter returns the underlying io.Writer
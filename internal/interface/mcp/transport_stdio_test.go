@@ -0,0 +1,62 @@
+package mcp
+
+import (
+	"bytes"
+	"context"
+	"io"
+	"testing"
+	"time"
+)
+
+// chanWriter hands every write to a channel so a test can observe when output arrives
+type chanWriter chan []byte
+
+func (w chanWriter) Write(p []byte) (int, error) {
+	w <- append([]byte(nil), p...)
+	return len(p), nil
+}
+
+func TestStdioTransport_FastResponseNotHeldBehindSlowRequest(t *testing.T) {
+	input, inputWriter := io.Pipe()
+	output := make(chanWriter, 4)
+	release := make(chan struct{})
+
+	transport := NewStdioTransport(&TransportConfig{Reader: input, Writer: output})
+	transport.SetRequestHandler(func(ctx context.Context, req *JSONRPCRequest) *JSONRPCResponse {
+		if req.Method == "slow" {
+			<-release
+		}
+		return &JSONRPCResponse{JSONRPC: "2.0", ID: req.ID, Result: req.Method}
+	})
+
+	done := make(chan error, 1)
+	go func() { done <- transport.Start(context.Background()) }()
+
+	// Pipeline both requests so the slow one is already queued when the fast one finishes
+	go inputWriter.Write([]byte(`{"jsonrpc":"2.0","id":1,"method":"fast"}` + "\n" +
+		`{"jsonrpc":"2.0","id":2,"method":"slow"}` + "\n"))
+
+	select {
+	case first := <-output:
+		if !bytes.Contains(first, []byte(`"id":1`)) || bytes.Contains(first, []byte(`"id":2`)) {
+			t.Fatalf("first write = %s, expected only the fast response", first)
+		}
+	case <-time.After(2 * time.Second):
+		t.Fatal("fast response was not written while the slow request was running")
+	}
+
+	close(release)
+	select {
+	case second := <-output:
+		if !bytes.Contains(second, []byte(`"id":2`)) {
+			t.Fatalf("second write = %s, expected the slow response", second)
+		}
+	case <-time.After(2 * time.Second):
+		t.Fatal("slow response was not written")
+	}
+
+	inputWriter.Close()
+	if err := <-done; err != nil {
+		t.Fatalf("Start returned error: %v", err)
+	}
+}
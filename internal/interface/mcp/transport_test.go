@@ -0,0 +1,122 @@
+package mcp
+
+import (
+	"bytes"
+	"context"
+	"encoding/json"
+	"testing"
+	"time"
+)
+
+// echoHandler answers every request with its method name; notifications get no response
+func echoHandler(ctx context.Context, req *JSONRPCRequest) *JSONRPCResponse {
+	if req.ID == nil {
+		return nil
+	}
+	return &JSONRPCResponse{JSONRPC: "2.0", ID: req.ID, Result: req.Method}
+}
+
+// slowFirstHandler makes earlier ids finish later, so batch responses complete out of order
+func slowFirstHandler(ctx context.Context, req *JSONRPCRequest) *JSONRPCResponse {
+	if id, ok := req.ID.(float64); ok {
+		time.Sleep(time.Duration(5-id) * 10 * time.Millisecond)
+	}
+	return echoHandler(ctx, req)
+}
+
+// panickingHandler panics on the "boom" method and echoes everything else
+func panickingHandler(ctx context.Context, req *JSONRPCRequest) *JSONRPCResponse {
+	if req.Method == "boom" {
+		panic("handler failure")
+	}
+	return echoHandler(ctx, req)
+}
+
+func TestDispatchMessage(t *testing.T) {
+	tests := []struct {
+		name     string
+		handler  RequestHandler
+		input    string
+		expected string
+	}{
+		{
+			name:     "single request",
+			handler:  echoHandler,
+			input:    `{"jsonrpc":"2.0","id":1,"method":"ping"}`,
+			expected: `{"jsonrpc":"2.0","id":1,"result":"ping"}`,
+		},
+		{
+			name:     "single notification",
+			handler:  echoHandler,
+			input:    `{"jsonrpc":"2.0","method":"notifications/initialized"}`,
+			expected: ``,
+		},
+		{
+			name:     "parse error",
+			handler:  echoHandler,
+			input:    `{"jsonrpc":"2.0",`,
+			expected: `{"jsonrpc":"2.0","error":{"code":-32700,"message":"Parse error","data":"unexpected end of JSON input"}}`,
+		},
+		{
+			name:     "batch parse error",
+			handler:  echoHandler,
+			input:    `[{"jsonrpc":"2.0","id":1,"method":"a"},`,
+			expected: `{"jsonrpc":"2.0","error":{"code":-32700,"message":"Parse error","data":"unexpected end of JSON input"}}`,
+		},
+		{
+			name:     "empty batch",
+			handler:  echoHandler,
+			input:    ` [ ] `,
+			expected: `{"jsonrpc":"2.0","error":{"code":-32600,"message":"Invalid Request","data":"empty batch"}}`,
+		},
+		{
+			name:    "batch with valid and invalid entries",
+			handler: echoHandler,
+			input:   `[{"jsonrpc":"2.0","id":1,"method":"a"},5,{"jsonrpc":"2.0","method":"n"},{"jsonrpc":"2.0","id":"x","method":"b"}]`,
+			expected: `[{"jsonrpc":"2.0","id":1,"result":"a"},` +
+				`{"jsonrpc":"2.0","error":{"code":-32600,"message":"Invalid Request","data":"json: cannot unmarshal number into Go value of type mcp.JSONRPCRequest"}},` +
+				`{"jsonrpc":"2.0","id":"x","result":"b"}]`,
+		},
+		{
+			name:    "batch entry whose handler panics",
+			handler: panickingHandler,
+			input:   `[{"jsonrpc":"2.0","id":1,"method":"a"},{"jsonrpc":"2.0","id":2,"method":"boom"}]`,
+			expected: `[{"jsonrpc":"2.0","id":1,"result":"a"},` +
+				`{"jsonrpc":"2.0","id":2,"error":{"code":-32603,"message":"Internal error","data":"handler failure"}}]`,
+		},
+		{
+			name:     "batch of notifications only",
+			handler:  echoHandler,
+			input:    `[{"jsonrpc":"2.0","method":"n1"},{"jsonrpc":"2.0","method":"n2"}]`,
+			expected: ``,
+		},
+		{
+			name:    "batch keeps request order under concurrency",
+			handler: slowFirstHandler,
+			input: `[{"jsonrpc":"2.0","id":1,"method":"a"},{"jsonrpc":"2.0","id":2,"method":"b"},` +
+				`{"jsonrpc":"2.0","id":3,"method":"c"},{"jsonrpc":"2.0","id":4,"method":"d"},` +
+				`{"jsonrpc":"2.0","id":5,"method":"e"}]`,
+			expected: `[{"jsonrpc":"2.0","id":1,"result":"a"},{"jsonrpc":"2.0","id":2,"result":"b"},` +
+				`{"jsonrpc":"2.0","id":3,"result":"c"},{"jsonrpc":"2.0","id":4,"result":"d"},` +
+				`{"jsonrpc":"2.0","id":5,"result":"e"}]`,
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			var buf bytes.Buffer
+			err := dispatchMessage(context.Background(), tt.handler, NewStdioResponseWriter(&buf), []byte(tt.input))
+			if err != nil {
+				t.Fatalf("dispatchMessage returned error: %v", err)
+			}
+
+			got := string(bytes.TrimSuffix(buf.Bytes(), []byte("\n")))
+			if got != tt.expected {
+				t.Errorf("output = %s\nexpected %s", got, tt.expected)
+			}
+			if got != "" && !json.Valid(buf.Bytes()) {
+				t.Errorf("output is not valid JSON: %s", got)
+			}
+		})
+	}
+}
@@ -4,56 +4,78 @@ Generate Go constants from mcp-tools.yaml specification.
 Only generates constants that are actually needed at compile time.
 """
 
-import yaml
+import os
 import sys
+import tempfile
 from pathlib import Path
 
+import yaml
+
 def load_spec(spec_path):
     """Load the MCP tools specification."""
-    with open(spec_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+    return yaml.safe_load(Path(spec_path).read_text(encoding='utf-8'))
 
 def generate_go_constants(spec_data, output_path):
     """Generate Go constants file."""
     
-    go_code = '''// Code generated by scripts/generate-tool-constants.py. DO NOT EDIT.
+    # Collect the output as a list of parts and join once at the end
+    parts = ['''// Code generated by scripts/generate-tool-constants.py. DO NOT EDIT.
 
 package constants
 
 // MCP Tool Names - Single source of truth from specs/mcp-tools.yaml
 const (
-'''
+''']
     
     # Generate tool name constants
     tools = spec_data.get('tools', {})
-    for tool_name, tool_def in tools.items():
-        const_name = f"Tool{tool_name.replace('_', '').title()}"
-        go_code += f'\t{const_name} = "{tool_def["name"]}"\n'
+    parts.extend(
+        f'\tTool{tool_name.replace("_", "").title()} = "{tool_def["name"]}"\n'
+        for tool_name, tool_def in tools.items()
+    )
     
-    go_code += ')\n\n'
+    parts.append(')\n\n')
     
     # Generate category constants
-    go_code += '// MCP Tool Categories\nconst (\n'
+    parts.append('// MCP Tool Categories\nconst (\n')
     categories = spec_data.get('categories', {})
-    for category, description in categories.items():
-        const_name = f"Category{category.title()}"
-        go_code += f'\t{const_name} = "{category}"\n'
+    parts.extend(
+        f'\tCategory{category.title()} = "{category}"\n'
+        for category in categories
+    )
     
-    go_code += ')\n\n'
+    parts.append(')\n\n')
     
     # Generate server info constants
     server_info = spec_data.get('server_info', {})
     if server_info:
-        go_code += '// Server Information\nconst (\n'
+        parts.append('// Server Information\nconst (\n')
         if 'composite_key_format' in server_info:
-            go_code += f'\tCompositeKeyFormat = "{server_info["composite_key_format"]}"\n'
+            parts.append(f'\tCompositeKeyFormat = "{server_info["composite_key_format"]}"\n')
         if 'version' in server_info:
-            go_code += f'\tServerVersion = "{server_info["version"]}"\n'
-        go_code += ')\n'
+            parts.append(f'\tServerVersion = "{server_info["version"]}"\n')
+        parts.append(')\n')
+    
+    go_code = ''.join(parts)
+    
+    # Write the file only when the generated content changed, so that an
+    # unchanged spec leaves the file and its mtime untouched
+    output_path = Path(output_path)
+    if output_path.exists() and output_path.read_text(encoding='utf-8') == go_code:
+        print(f"Go constants up to date: {output_path}")
+        return
     
-    # Write the file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(go_code)
+    # Write to a temporary file in the same directory and atomically swap it in,
+    # so readers never observe a truncated or half-written file
+    fd, tmp_path = tempfile.mkstemp(dir=output_path.parent, prefix=f'.{output_path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(go_code)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
     
     print(f"Generated Go constants: {output_path}")
 